@@ -6,9 +6,9 @@ import requests
 
 from .app import main
 from .arguments import build_parser
-from .colours import ColourStyle, RESET, COLOUR_STYLES, cycle_colours
+from .colours import ColourStyle, RESET, COLOUR_STYLES, colour_for_index, cycle_colours
 from .debug import DEBUG_ENABLED, debug_log, set_debug
-from .downloader import DownloadRunner
+from .downloader import DownloadRunner, LineBuffer
 from .expansion import expand_pids
 from .filesystem import (
     cleanup_download_directories,
@@ -26,17 +26,21 @@ from .metadata import (
     build_program_label,
     format_plex_filename,
     get_bbc_episode_pids,
+    get_bbc_episode_pids_via_get_iplayer_batch,
     get_cached_metadata,
+    map_http,
     _get_bbc_episode_pids_via_get_iplayer,
 )
 from .pids import (
     BBC_IPLAYER_SERIES_BRAND_PREFIX,
     BBC_IPLAYER_SINGLE_EPISODE_PREFIX,
     PID_PATTERN,
+    is_pid,
     normalise_pid,
 )
 from .progress import ProgressTracker
 from .utils import (
+    LRUCache,
     dedupe_preserve_order,
     extract_broadcast_date,
     format_command,
@@ -68,6 +72,8 @@ __all__ = [
     "ColourStyle",
     "DEBUG_ENABLED",
     "DownloadRunner",
+    "LRUCache",
+    "LineBuffer",
     "PID_METADATA",
     "PID_PATTERN",
     "PROGRAM_LABEL_WIDTH",
@@ -78,6 +84,7 @@ __all__ = [
     "build_parser",
     "build_program_label",
     "cleanup_download_directories",
+    "colour_for_index",
     "cycle_colours",
     "debug_log",
     "dedupe_preserve_order",
@@ -88,10 +95,13 @@ __all__ = [
     "format_command",
     "format_plex_filename",
     "get_bbc_episode_pids",
+    "get_bbc_episode_pids_via_get_iplayer_batch",
     "get_cached_metadata",
     "get_iplayer_invocation",
+    "is_pid",
     "locate_download_directory",
     "main",
+    "map_http",
     "move_video_to_root",
     "normalise_pid",
     "next_delimiter",
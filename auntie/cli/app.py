@@ -4,20 +4,22 @@ from __future__ import annotations
 
 import sys
 import threading
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import Sequence
 
 from tqdm import tqdm
 
+from . import debug
 from .arguments import build_parser
-from .colours import cycle_colours
-from .debug import DEBUG_ENABLED, set_debug
+from .colours import colour_for_index
 from .downloader import DownloadRunner
 from .expansion import expand_pids
-from .metadata import build_program_label
+from .metadata import build_program_label, get_cached_metadata
 from .pids import normalise_pid
 from .progress import ProgressTracker
 
+METADATA_WORKERS = 8
+
 
 def main(argv: Sequence[str] | None = None) -> int:
     progress = ProgressTracker()
@@ -26,18 +28,20 @@ def main(argv: Sequence[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
 
-    set_debug(bool(getattr(args, "debug", False)))
-    if DEBUG_ENABLED:
+    debug.set_debug(bool(getattr(args, "debug", False)))
+    if debug.DEBUG_ENABLED:
         tqdm.write("[debug] Debug logging enabled")
 
     normalised_pids = [normalise_pid(pid) for pid in args.pids]
     expanded_pids = expand_pids(normalised_pids)
 
-    for pid in expanded_pids:
-        progress.register_label(pid, build_program_label(pid))
+    # Labels (and Plex renames) need each PID's BBC metadata; fetch it concurrently
+    # so the lookups overlap instead of running one round trip at a time.
+    with ThreadPoolExecutor(max_workers=METADATA_WORKERS) as metadata_executor:
+        for pid, _ in zip(expanded_pids, metadata_executor.map(get_cached_metadata, expanded_pids)):
+            progress.register_label(pid, build_program_label(pid))
 
     max_threads = max(1, args.threads)
-    colour_iter = cycle_colours()
 
     results: dict[str, int] = {}
     print_lock = threading.Lock()
@@ -47,12 +51,14 @@ def main(argv: Sequence[str] | None = None) -> int:
     failures: dict[str, int] = {}
     clean_temp = not args.no_clean
     executor: ThreadPoolExecutor | None = None
+    cleanup_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cleanup")
 
     runner = DownloadRunner(
         progress,
         plex_mode=bool(args.plex),
         clean_temp=clean_temp,
         print_lock=print_lock,
+        cleanup_executor=cleanup_executor,
     )
 
     try:
@@ -62,18 +68,36 @@ def main(argv: Sequence[str] | None = None) -> int:
             cursor_hidden = True
 
         executor = ThreadPoolExecutor(max_workers=max_threads)
-        futures = {
-            executor.submit(runner.run, pid, next(colour_iter)): pid for pid in expanded_pids
-        }
+        # Keep a bounded window of submitted work so large brand expansions do not
+        # materialise a future (and its closure state) for every PID up front.
+        max_in_flight = max_threads * 2
+        pending_pids = enumerate(expanded_pids)
+        in_flight: dict[Future[int], str] = {}
+
+        def submit_next() -> None:
+            item = next(pending_pids, None)
+            if item is not None:
+                index, pid = item
+                in_flight[executor.submit(runner.run, pid, colour_for_index(index))] = pid
 
         try:
-            for future, pid in futures.items():
-                results[pid] = future.result()
+            for _ in range(max_in_flight):
+                submit_next()
+            while in_flight:
+                # Wait on every in-flight download at once, so replacements submitted as
+                # slots free up are collected as soon as they finish rather than after the
+                # previous snapshot drains.
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pid = in_flight.pop(future)
+                    results[pid] = future.result()
+                    submit_next()
         except KeyboardInterrupt:
             interrupted = True
-            for future in futures:
-                future.cancel()
-            executor.shutdown(wait=True, cancel_futures=True)
+            # Drop queued downloads immediately, then let running workers tidy up
+            # their temporary directories before the summary is printed.
+            executor.shutdown(wait=False, cancel_futures=True)
+            executor.shutdown(wait=True)
             executor = None
             raise
         finally:
@@ -87,10 +111,11 @@ def main(argv: Sequence[str] | None = None) -> int:
         failures = {pid: code for pid, code in results.items() if code != 0}
 
         if summary_lines:
-            sys.stdout.write("\r")
+            # One write and one flush for the whole summary rather than one per bar.
+            sys.stdout.write("\r" + "\n".join(summary_lines) + "\n")
             sys.stdout.flush()
-        for line in summary_lines:
-            print(line)
+
+        cleanup_executor.shutdown(wait=True)
 
         if cursor_hidden and sys.stdout.isatty():
             sys.stdout.write("\033[?25h")
@@ -43,8 +43,11 @@ def build_parser() -> argparse.ArgumentParser:
         "-t",
         "--threads",
         type=int,
-        default=os.cpu_count() or 4,
-        help="maximum number of parallel download workers",
+        default=min(32, (os.cpu_count() or 4) * 4),
+        help=(
+            "maximum number of parallel download workers; the default scales with cores but "
+            "caps at 32 to match typical server concurrency limits"
+        ),
     )
     parser.add_argument(
         "-v",
@@ -3,16 +3,21 @@
 from __future__ import annotations
 
 import itertools
-from dataclasses import dataclass
-from typing import Iterable, Tuple
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Tuple
 
 RESET = "\033[0m"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ColourStyle:
     tqdm_name: str
     ansi_code: str
+    # Wraps text in this colour and RESET; a bound str.format, so no Python frame per call.
+    colorize: Callable[[str], str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "colorize", f"{self.ansi_code}{{}}{RESET}".format)
 
 
 COLOUR_STYLES: Tuple[ColourStyle, ...] = (
@@ -51,4 +56,10 @@ def cycle_colours() -> Iterable[ColourStyle]:
     return itertools.cycle(palette)
 
 
-__all__ = ["ColourStyle", "COLOUR_STYLES", "RESET", "cycle_colours"]
+def colour_for_index(index: int) -> ColourStyle:
+    """Return the palette colour for the *index*-th download."""
+    palette = COLOUR_STYLES if COLOUR_STYLES else (_FALLBACK_STYLE,)
+    return palette[index % len(palette)]
+
+
+__all__ = ["ColourStyle", "COLOUR_STYLES", "RESET", "colour_for_index", "cycle_colours"]
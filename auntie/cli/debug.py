@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Final
+from typing import Callable, Final
 
 from tqdm import tqdm
 
@@ -10,21 +10,34 @@ DEBUG_PREFIX: Final[str] = "[debug] "
 DEBUG_ENABLED: bool = False
 
 
+def _write_debug(message: str) -> None:
+    try:
+        tqdm.write(f"{DEBUG_PREFIX}{message}")
+    except Exception:
+        # tqdm can raise exceptions while finalising progress bars; ignore them quietly.
+        pass
+
+
+def _discard_debug(message: str) -> None:
+    pass
+
+
+# Hot-path logger, rebound by set_debug() so disabled logging is a bare no-op call.
+# Call it through the module (``debug.log(...)``) so the rebinding is visible.
+log: Callable[[str], None] = _discard_debug
+
+
 def set_debug(enabled: bool) -> None:
     """Enable or disable verbose debug logging."""
-    global DEBUG_ENABLED
+    global DEBUG_ENABLED, log
     DEBUG_ENABLED = bool(enabled)
+    log = _write_debug if DEBUG_ENABLED else _discard_debug
 
 
 def debug_log(message: str) -> None:
     """Emit a debug log line if debugging is enabled."""
-    if not DEBUG_ENABLED:
-        return
-    try:
-        tqdm.write(f"{DEBUG_PREFIX}{message}")
-    except Exception:
-        # tqdm can raise exceptions while finalising progress bars; ignore them quietly.
-        pass
+    if DEBUG_ENABLED:
+        _write_debug(message)
 
 
-__all__ = ["DEBUG_ENABLED", "debug_log", "set_debug"]
+__all__ = ["DEBUG_ENABLED", "debug_log", "log", "set_debug"]
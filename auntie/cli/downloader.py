@@ -2,21 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 import codecs
 import errno
 import os
-import secrets
-import select
 import subprocess
+import tempfile
 import threading
+from collections import deque
+from concurrent.futures import Executor
 from pathlib import Path
-from queue import Empty, Queue
-from typing import BinaryIO
+from typing import Sequence
 
 from tqdm import tqdm
 
+from . import debug
 from .colours import ColourStyle
-from .debug import debug_log
 from .filesystem import (
     cleanup_download_directories,
     find_downloaded_video,
@@ -26,7 +27,256 @@ from .filesystem import (
 )
 from .iplayer import build_download_command
 from .progress import ProgressTracker
-from .utils import format_command, next_delimiter
+from .utils import format_command
+
+READ_CHUNK_SIZE = 65536
+IDLE_POLL_INTERVAL = 1.0
+COMPACT_THRESHOLD = 65536
+
+_CR = ord("\r")
+_LF = ord("\n")
+
+_utf8_decoder = codecs.getincrementaldecoder("utf-8")
+
+
+class LineBuffer:
+    """Split raw get_iplayer output into lines without re-copying the unread tail."""
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._pos = 0
+        self._last_partial = ""
+
+    def feed(self, raw: bytes) -> list[str]:
+        """Consume *raw* and return the complete lines it finishes.
+
+        When a carriage return was seen, the unterminated tail is returned as well so
+        in-place progress updates are reported before the next delimiter arrives.
+        """
+        self._buffer.extend(raw)
+        lines, saw_carriage = self._split_lines()
+        if saw_carriage and self._pos < len(self._buffer):
+            # A code point split across reads is held back until the rest of it arrives.
+            partial = _utf8_decoder(errors="replace").decode(self._buffer[self._pos :])
+            if partial and partial != self._last_partial:
+                lines.append(partial)
+                self._last_partial = partial
+        self._compact()
+        return lines
+
+    def finish(self) -> list[str]:
+        """Return every remaining line, including an unterminated tail."""
+        lines, _ = self._split_lines()
+        if self._pos < len(self._buffer):
+            lines.append(self._buffer[self._pos :].decode("utf-8", errors="replace"))
+        self._buffer.clear()
+        self._pos = 0
+        return lines
+
+    def _split_lines(self) -> tuple[list[str], bool]:
+        buffer = self._buffer
+        pos = self._pos
+        if pos >= len(buffer):
+            return [], False
+        # bytes.splitlines() breaks only at CR, LF and CRLF, so one C-level pass splits the
+        # whole unread tail; an unterminated last piece stays in the buffer.
+        pieces = buffer[pos:].splitlines(keepends=True)
+        if pieces[-1][-1] not in (_CR, _LF):
+            pieces.pop()
+        lines: list[str] = []
+        saw_carriage = False
+        for piece in pieces:
+            pos += len(piece)
+            if piece[-1] == _LF:
+                end = -2 if len(piece) > 1 and piece[-2] == _CR else -1
+                saw_carriage = saw_carriage or end == -2
+            else:
+                end = -1
+                saw_carriage = True
+            # Delimiters are ASCII, so a complete line never ends mid code point and can
+            # be decoded on its own without carrying decoder state between reads. Empty
+            # lines (including the LF of a CRLF split across reads) are never decoded.
+            if len(piece) + end:
+                lines.append(piece[:end].decode("utf-8", errors="replace"))
+        if pieces:
+            self._last_partial = ""
+        self._pos = pos
+        return lines, saw_carriage
+
+    def _compact(self) -> None:
+        if self._pos >= len(self._buffer):
+            self._buffer.clear()
+            self._pos = 0
+        elif self._pos > COMPACT_THRESHOLD:
+            del self._buffer[: self._pos]
+            self._pos = 0
+
+
+class ChunkQueue:
+    """Hand output chunks from a producer to one consumer without Queue's bookkeeping."""
+
+    def __init__(self) -> None:
+        self._chunks: deque[bytes] = deque()
+        self._ready = threading.Condition()
+
+    def put(self, chunk: bytes) -> None:
+        self._chunks.append(chunk)
+        with self._ready:
+            self._ready.notify()
+
+    def get(self, timeout: float) -> bytes | None:
+        """Return the next chunk, or ``None`` if nothing arrives within *timeout*."""
+        chunks = self._chunks
+        if not chunks:
+            with self._ready:
+                if not chunks:
+                    self._ready.wait(timeout)
+        return chunks.popleft() if chunks else None
+
+
+_io_loop: asyncio.AbstractEventLoop | None = None
+_io_loop_lock = threading.Lock()
+
+
+def _shared_io_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop that reads every download's output."""
+    global _io_loop
+    with _io_loop_lock:
+        if _io_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="subprocess-io", daemon=True).start()
+            _io_loop = loop
+        return _io_loop
+
+
+class PtyPump:
+    """Drain a PTY master on the shared I/O loop into a ChunkQueue.
+
+    Every download's PTY is watched by the one selector behind the shared loop (epoll on
+    Linux), so a single thread wakes for output from all children instead of each worker
+    polling its own descriptor. The pump owns *master_fd* and closes it at EOF.
+
+    Given the child's *pid*, the pump also watches a pidfd for its exit (Linux 5.3+), so
+    output ends as soon as the child does even if a grandchild still holds the PTY open,
+    rather than when the worker next polls the process.
+    """
+
+    def __init__(self, master_fd: int, output: ChunkQueue, pid: int | None = None) -> None:
+        self._fd = master_fd
+        self._output = output
+        self._error: OSError | None = None
+        self._closed = threading.Event()
+        self._pidfd: int | None = None
+        if pid is not None and hasattr(os, "pidfd_open"):
+            try:
+                # Opened here rather than on the loop so the child cannot be reaped first.
+                self._pidfd = os.pidfd_open(pid)
+            except OSError:
+                self._pidfd = None
+        os.set_blocking(master_fd, False)
+        self._loop = _shared_io_loop()
+        self._loop.call_soon_threadsafe(self._watch)
+
+    def _watch(self) -> None:
+        self._loop.add_reader(self._fd, self._on_readable)
+        if self._pidfd is not None:
+            self._loop.add_reader(self._pidfd, self._on_exit)
+
+    def _read(self) -> bytes | None:
+        """Read one chunk; ``b""`` means end of output and ``None`` nothing available yet."""
+        try:
+            return os.read(self._fd, READ_CHUNK_SIZE)
+        except BlockingIOError:
+            return None
+        except OSError as exc:
+            # Linux reports EIO once the last slave descriptor closes.
+            if exc.errno != errno.EIO:
+                self._error = exc
+            return b""
+
+    def _on_readable(self) -> None:
+        raw = self._read()
+        if raw:
+            self._output.put(raw)
+        elif raw is not None:
+            self._finish()
+
+    def _on_exit(self) -> None:
+        # Collect whatever the child wrote before exiting, then end the stream.
+        while not self._closed.is_set():
+            raw = self._read()
+            if not raw:
+                self._finish()
+                return
+            self._output.put(raw)
+
+    def _finish(self) -> None:
+        # Only ever runs on the loop thread, so the descriptor cannot be closed under a
+        # pending read.
+        if self._closed.is_set():
+            return
+        try:
+            self._loop.remove_reader(self._fd)
+            os.close(self._fd)
+            if self._pidfd is not None:
+                self._loop.remove_reader(self._pidfd)
+                os.close(self._pidfd)
+        finally:
+            self._closed.set()
+            self._output.put(b"")
+
+    def close(self) -> None:
+        """Stop reading and close the PTY master, waiting until the loop has done so."""
+        if not self._closed.is_set():
+            self._loop.call_soon_threadsafe(self._finish)
+            self._closed.wait()
+
+    def raise_error(self) -> None:
+        """Re-raise a read error other than the end-of-output EIO."""
+        if self._error is not None:
+            raise self._error
+
+
+class AsyncioProcess:
+    """Popen-like handle for a get_iplayer process driven by a shared event loop.
+
+    Windows has no PTYs, so output is read from pipes instead. Rather than a reader
+    thread per download, every process is spawned and drained on one background
+    asyncio loop (the IOCP-backed proactor loop on Windows), which pushes output
+    chunks onto the caller's ChunkQueue.
+    """
+
+    def __init__(self, command: Sequence[str], output: ChunkQueue) -> None:
+        loop = _shared_io_loop()
+        self._process = asyncio.run_coroutine_threadsafe(self._spawn(command), loop).result()
+        self._pump = asyncio.run_coroutine_threadsafe(self._drain(output), loop)
+
+    @staticmethod
+    async def _spawn(command: Sequence[str]) -> asyncio.subprocess.Process:
+        return await asyncio.create_subprocess_exec(
+            *command,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+
+    async def _drain(self, output: ChunkQueue) -> int:
+        stdout = self._process.stdout
+        try:
+            while stdout is not None:
+                chunk = await stdout.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                output.put(chunk)
+        finally:
+            output.put(b"")
+        return await self._process.wait()
+
+    def poll(self) -> int | None:
+        return self._process.returncode
+
+    def wait(self) -> int:
+        return self._pump.result()
 
 
 class DownloadRunner:
@@ -39,47 +289,32 @@ class DownloadRunner:
         plex_mode: bool,
         clean_temp: bool,
         print_lock: threading.Lock,
+        cleanup_executor: Executor | None = None,
     ) -> None:
         self._progress = progress
         self._plex_mode = plex_mode
         self._clean_temp = clean_temp
         self._print_lock = print_lock
+        self._cleanup_executor = cleanup_executor
 
     def run(self, pid: str, colour: ColourStyle) -> int:
-        token = ""
-        expected_download_dir = Path()
-        while True:
-            token = secrets.token_hex(4)
-            subdir_name = f".auntie-{pid}-{token}"
-            expected_download_dir = Path.cwd() / subdir_name
-            if not expected_download_dir.exists():
-                break
-            if self._clean_temp:
-                try:
-                    cleanup_download_directories(
-                        {expected_download_dir: True}, pid, self._print_lock
-                    )
-                except Exception as exc:  # pragma: no cover - extremely unlikely
-                    with self._print_lock:
-                        tqdm.write(f"{pid}: unable to clear previous download directory ({exc})")
-                    return 1
-                break
-        expected_download_dir.mkdir(parents=True, exist_ok=True)
+        cwd = Path.cwd()
+        # mkdtemp creates the directory atomically, so there is no name collision to retry.
+        expected_download_dir = Path(tempfile.mkdtemp(prefix=f".auntie-{pid}-", dir=cwd))
+        token = expected_download_dir.name.rsplit("-", 1)[-1]
         command = build_download_command(pid, expected_download_dir)
-        debug_log(f"{pid}: using download subdir {expected_download_dir.name}")
-        debug_log(f"{pid}: launching get_iplayer with command: {format_command(command)}")
+        debug.log(f"{pid}: using download subdir {expected_download_dir.name}")
+        debug.log(f"{pid}: launching get_iplayer with command: {format_command(command)}")
 
         download_dir: Path | None = None
         moved_video: Path | None = None
         master_fd: int | None = None
         slave_fd: int | None = None
-        process: subprocess.Popen | None = None
-        output_queue: Queue[bytes] | None = None
-        reader_thread: threading.Thread | None = None
+        process: subprocess.Popen | AsyncioProcess | None = None
+        output_queue = ChunkQueue()
+        pty_pump: PtyPump | None = None
         using_pty = os.name != "nt"
-        decoder = None
-        buffer = ""
-        last_partial = ""
+        line_buffer = LineBuffer()
 
         cleanup_map: dict[Path, bool] = {expected_download_dir: self._clean_temp}
 
@@ -90,7 +325,7 @@ class DownloadRunner:
                 except OSError as exc:
                     with self._print_lock:
                         tqdm.write(f"{pid}: unable to allocate pty ({exc})")
-                    debug_log(f"{pid}: unable to allocate PTY ({exc})")
+                    debug.log(f"{pid}: unable to allocate PTY ({exc})")
                     return 1
 
             try:
@@ -105,15 +340,7 @@ class DownloadRunner:
                         close_fds=True,
                     )
                 else:
-                    process = subprocess.Popen(
-                        command,
-                        stdin=subprocess.DEVNULL,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.STDOUT,
-                        text=False,
-                        bufsize=0,
-                        close_fds=False,
-                    )
+                    process = AsyncioProcess(command, output_queue)
             except FileNotFoundError:
                 if master_fd is not None:
                     os.close(master_fd)
@@ -123,7 +350,7 @@ class DownloadRunner:
                     slave_fd = None
                 with self._print_lock:
                     tqdm.write(f"{pid}: get_iplayer command not found")
-                debug_log(f"{pid}: get_iplayer command not found when launching")
+                debug.log(f"{pid}: get_iplayer command not found when launching")
                 return 127
             except OSError as exc:
                 if master_fd is not None:
@@ -134,130 +361,47 @@ class DownloadRunner:
                     slave_fd = None
                 with self._print_lock:
                     tqdm.write(f"{pid}: failed to start get_iplayer ({exc})")
-                debug_log(f"{pid}: failed to start get_iplayer ({exc})")
+                debug.log(f"{pid}: failed to start get_iplayer ({exc})")
                 return 1
 
             if using_pty and slave_fd is not None:
                 os.close(slave_fd)
                 slave_fd = None
-            elif not using_pty:
-                assert process is not None
-                stdout_pipe = process.stdout
-                if stdout_pipe is None:
-                    raise RuntimeError("process stdout pipe not available on Windows")
-                output_queue = Queue()
-
-                def _drain_stdout(pipe: BinaryIO, queue: Queue[bytes]) -> None:
-                    try:
-                        while True:
-                            chunk = pipe.read(1024)
-                            if not chunk:
-                                break
-                            queue.put(chunk)
-                    except Exception:
-                        pass
-                    finally:
-                        queue.put(b"")
-
-                reader_thread = threading.Thread(
-                    target=_drain_stdout, args=(stdout_pipe, output_queue), daemon=True
-                )
-                reader_thread.start()
+                pty_pump = PtyPump(master_fd, output_queue, process.pid)
+                master_fd = None
 
             colour = self._progress.colour_for_pid(pid, colour)
             self._progress.start_pseudo_stream(pid, "waiting", colour)
-            decoder = codecs.getincrementaldecoder("utf-8")()
-            buffer = ""
-            last_partial = ""
             try:
                 while True:
-                    if using_pty:
-                        ready, _, _ = select.select([master_fd], [], [], 0.1)
-                        if not ready:
-                            if process.poll() is not None:
-                                break
-                            self._progress.tick_pseudo_stream(pid, "waiting", colour)
-                            self._progress.tick_pseudo_stream(pid, "converting", colour)
-                            continue
-                        try:
-                            raw = os.read(master_fd, 1024)
-                        except BlockingIOError:
-                            continue
-                        except OSError as exc:
-                            if exc.errno == errno.EIO:
-                                break
-                            raise
-                    else:
-                        assert output_queue is not None
-                        try:
-                            raw = output_queue.get(timeout=0.1)
-                        except Empty:
-                            if process.poll() is not None:
-                                break
-                            self._progress.tick_pseudo_stream(pid, "waiting", colour)
-                            self._progress.tick_pseudo_stream(pid, "converting", colour)
-                            continue
-                    if not raw:
+                    raw = output_queue.get(IDLE_POLL_INTERVAL)
+                    if raw is None:
                         if process.poll() is not None:
                             break
                         continue
-                    text = decoder.decode(raw) if raw else ""
-                    if not text:
-                        continue
-                    buffer += text
-                    self._progress.tick_pseudo_stream(pid, "waiting", colour)
-                    self._progress.tick_pseudo_stream(pid, "converting", colour)
-                    saw_carriage = False
-                    while True:
-                        delimiter_index = next_delimiter(buffer)
-                        if delimiter_index is None:
-                            break
-                        delimiter_char = buffer[delimiter_index]
-                        line = buffer[:delimiter_index]
-                        remainder = buffer[delimiter_index + 1 :]
-                        if delimiter_char == "\r" and remainder.startswith("\n"):
-                            remainder = remainder[1:]
-                        buffer = remainder
-                        self._progress.emit_progress_line(pid, colour, line)
-                        last_partial = ""
-                        if delimiter_char == "\r":
-                            saw_carriage = True
-                    if saw_carriage and buffer and buffer != last_partial:
-                        self._progress.emit_progress_line(pid, colour, buffer)
-                        last_partial = buffer
+                    if not raw:
+                        # The pumps queue an empty chunk once the output reaches EOF.
+                        break
+                    self._progress.emit_progress_lines(pid, colour, line_buffer.feed(raw))
             finally:
-                if master_fd is not None and using_pty:
-                    os.close(master_fd)
-                    master_fd = None
+                if pty_pump is not None:
+                    pty_pump.close()
+            if pty_pump is not None:
+                pty_pump.raise_error()
 
-            if decoder is not None:
-                buffer += decoder.decode(b"", final=True)
-            while True:
-                delimiter_index = next_delimiter(buffer)
-                if delimiter_index is None:
-                    break
-                delimiter_char = buffer[delimiter_index]
-                line = buffer[:delimiter_index]
-                remainder = buffer[delimiter_index + 1 :]
-                if delimiter_char == "\r" and remainder.startswith("\n"):
-                    remainder = remainder[1:]
-                buffer = remainder
-                self._progress.emit_progress_line(pid, colour, line)
-                last_partial = ""
-            if buffer:
-                self._progress.emit_progress_line(pid, colour, buffer)
+            self._progress.emit_progress_lines(pid, colour, line_buffer.finish())
 
             return_code = process.wait()
-            debug_log(f"{pid}: get_iplayer exited with code {return_code}")
+            debug.log(f"{pid}: get_iplayer exited with code {return_code}")
             self._progress.mark_pid_complete(pid)
             self._progress.complete_pseudo_stream(pid, "waiting", colour)
             self._progress.complete_pseudo_stream(pid, "converting", colour)
 
-            download_dir = locate_download_directory(token, pid)
+            download_dir = locate_download_directory(token, pid, cwd)
             if download_dir is not None:
                 cleanup_map[download_dir] = self._clean_temp
 
-            debug_log(f"{pid}: located download directory {download_dir}")
+            debug.log(f"{pid}: located download directory {download_dir}")
             if download_dir and download_dir.exists():
                 if return_code == 0:
                     video_path = find_downloaded_video(download_dir)
@@ -266,7 +410,7 @@ class DownloadRunner:
                             tqdm.write(f"{pid}: no video file found in download directory")
                         return_code = max(return_code, 1)
                     else:
-                        moved_video = move_video_to_root(video_path, self._print_lock)
+                        moved_video = move_video_to_root(video_path, self._print_lock, cwd)
                         if moved_video is None:
                             return_code = max(return_code, 1)
             elif return_code == 0:
@@ -281,13 +425,8 @@ class DownloadRunner:
 
             return return_code
         finally:
-            if reader_thread is not None:
-                reader_thread.join()
-            if process is not None and process.stdout:
-                try:
-                    process.stdout.close()
-                except Exception:
-                    pass
+            if pty_pump is not None:
+                pty_pump.close()
             if slave_fd is not None:
                 try:
                     os.close(slave_fd)
@@ -298,7 +437,14 @@ class DownloadRunner:
                     os.close(master_fd)
                 except OSError:
                     pass
-            cleanup_download_directories(cleanup_map, pid, self._print_lock)
+            if self._cleanup_executor is not None:
+                # Removing a large temporary tree should not keep this worker from
+                # starting the next download.
+                self._cleanup_executor.submit(
+                    cleanup_download_directories, cleanup_map, pid, self._print_lock
+                )
+            else:
+                cleanup_download_directories(cleanup_map, pid, self._print_lock)
 
 
 __all__ = ["DownloadRunner"]
@@ -4,31 +4,61 @@ from __future__ import annotations
 
 from typing import Sequence
 
-from .debug import debug_log
-from .metadata import get_bbc_episode_pids
+from . import debug
+from .metadata import (
+    HTTP_POOL_SIZE,
+    get_bbc_episode_pids,
+    get_bbc_episode_pids_via_get_iplayer_batch,
+    map_http,
+)
 from .pids import normalise_pid
+from .utils import dedupe_preserve_order
 
+MAX_EXPANSION_WORKERS = HTTP_POOL_SIZE
+
+
+def _lookup_episode_pids(pid: str) -> list[str] | None:
+    try:
+        episode_pids = get_bbc_episode_pids(pid, fallback=False)
+    except Exception as exc:
+        debug.log(f"Failed to expand {pid}: {exc!r}")
+        return []
+    if not episode_pids:
+        return None
+    episode_pids = [normalise_pid(ep) for ep in episode_pids]
+    debug.log(f"Expanded {pid} into {episode_pids}")
+    return episode_pids
 
-def expand_pids(pids: Sequence[str]) -> list[str]:
-    expanded: list[str] = []
-    seen: set[str] = set()
-
-    for raw_pid in pids:
-        pid = normalise_pid(raw_pid)
-        try:
-            episode_pids = [normalise_pid(ep) for ep in get_bbc_episode_pids(pid)]
-            debug_log(f"Expanded {pid} into {episode_pids or '[no additional episodes]'}")
-        except Exception as exc:
-            debug_log(f"Failed to expand {pid}: {exc!r}")
-            episode_pids = []
-
-        candidates = episode_pids or [pid]
-        for candidate in candidates:
-            if candidate not in seen:
-                expanded.append(candidate)
-                seen.add(candidate)
 
+def _fallback_episode_pids(pids: list[str]) -> dict[str, list[str]]:
+    try:
+        batch = get_bbc_episode_pids_via_get_iplayer_batch(pids)
+    except Exception as exc:
+        debug.log(f"Failed to expand {pids} via get_iplayer: {exc!r}")
+        return {}
+    expanded = {pid: [normalise_pid(ep) for ep in batch.get(pid, [])] for pid in pids}
+    for pid, episode_pids in expanded.items():
+        debug.log(f"Expanded {pid} into {episode_pids or '[no additional episodes]'}")
     return expanded
 
 
+def expand_pids(pids: Sequence[str]) -> list[str]:
+    normalised = [normalise_pid(raw_pid) for raw_pid in pids]
+    if not normalised:
+        return []
+
+    # Lookups are network bound, so resolve them concurrently; map() keeps input order.
+    lookups = map_http(_lookup_episode_pids, normalised, MAX_EXPANSION_WORKERS)
+
+    # PIDs the API could not resolve share one get_iplayer run instead of one each.
+    unresolved = [pid for pid, episode_pids in zip(normalised, lookups) if episode_pids is None]
+    fallback = _fallback_episode_pids(dedupe_preserve_order(unresolved)) if unresolved else {}
+
+    return dedupe_preserve_order(
+        candidate
+        for pid, episode_pids in zip(normalised, lookups)
+        for candidate in (fallback.get(pid) if episode_pids is None else episode_pids) or [pid]
+    )
+
+
 __all__ = ["expand_pids"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import shutil
 from pathlib import Path
 from typing import Dict
@@ -39,45 +40,59 @@ def ensure_unique_path(directory: Path, filename: str) -> Path:
         index += 1
 
 
-def locate_download_directory(token: str, pid: str) -> Path | None:
-    expected = Path.cwd() / f".auntie-{pid}-{token}"
+def locate_download_directory(token: str, pid: str, cwd: Path | None = None) -> Path | None:
+    cwd = cwd if cwd is not None else Path.cwd()
+    expected = cwd / f".auntie-{pid}-{token}"
     if expected.exists():
         return expected
     suffix = f"-{pid}-{token}"
-    for candidate in Path.cwd().iterdir():
-        if (
-            candidate.is_dir()
-            and candidate.name.startswith(".auntie-")
-            and candidate.name.endswith(suffix)
-        ):
-            return candidate
+    with os.scandir(cwd) as entries:
+        for entry in entries:
+            name = entry.name
+            if (
+                name.startswith(".auntie-")
+                and name.endswith(suffix)
+                and entry.is_dir(follow_symlinks=False)
+            ):
+                return Path(entry.path)
     return None
 
 
 def find_downloaded_video(download_dir: Path) -> Path | None:
-    best_candidate: tuple[float, int, Path] | None = None
-    for path in download_dir.rglob("*"):
-        if not path.is_file():
-            continue
-        if path.suffix.lower() not in VIDEO_EXTENSIONS:
-            continue
+    best_candidate: tuple[float, int, str] | None = None
+    pending = [str(download_dir)]
+    while pending:
         try:
-            stat = path.stat()
-        except FileNotFoundError:
+            entries = os.scandir(pending.pop())
+        except OSError:
             continue
-        candidate_key = (stat.st_mtime, stat.st_size)
-        if best_candidate is None or candidate_key > best_candidate[:2]:
-            best_candidate = (stat.st_mtime, stat.st_size, path)
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                    continue
+                if os.path.splitext(entry.name)[1].lower() not in VIDEO_EXTENSIONS:
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                candidate_key = (stat.st_mtime, stat.st_size)
+                if best_candidate is None or candidate_key > best_candidate[:2]:
+                    best_candidate = (stat.st_mtime, stat.st_size, entry.path)
     if best_candidate is None:
         return None
-    return best_candidate[2]
+    return Path(best_candidate[2])
 
 
 def move_video_to_root(
     video_path: Path,
     print_lock,
+    cwd: Path | None = None,
 ) -> Path | None:
-    destination = ensure_unique_path(Path.cwd(), video_path.name)
+    destination = ensure_unique_path(cwd if cwd is not None else Path.cwd(), video_path.name)
     try:
         destination.parent.mkdir(parents=True, exist_ok=True)
         video_path.rename(destination)
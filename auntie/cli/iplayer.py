@@ -4,20 +4,20 @@ from __future__ import annotations
 
 import os
 import shutil
-from functools import lru_cache
+from functools import cache
 from pathlib import Path
 from typing import Sequence, Tuple
 
-from .debug import debug_log
+from . import debug
 from .pids import normalise_pid
 from .utils import format_command
 
 
-@lru_cache(maxsize=1)
+@cache
 def resolve_get_iplayer_entrypoint() -> str:
     override = os.environ.get("GET_IPLAYER_COMMAND")
     if override:
-        debug_log(f"Using get_iplayer entrypoint from GET_IPLAYER_COMMAND: {override}")
+        debug.log(f"Using get_iplayer entrypoint from GET_IPLAYER_COMMAND: {override}")
         return override
     if os.name == "nt":
         candidates = (
@@ -31,7 +31,7 @@ def resolve_get_iplayer_entrypoint() -> str:
     for candidate in candidates:
         resolved = shutil.which(candidate)
         if resolved:
-            debug_log(f"Found get_iplayer on PATH: {resolved}")
+            debug.log(f"Found get_iplayer on PATH: {resolved}")
             return resolved
     if os.name == "nt":
         probable_locations = []
@@ -43,14 +43,14 @@ def resolve_get_iplayer_entrypoint() -> str:
         for candidate in probable_locations:
             if candidate.exists():
                 resolved = str(candidate)
-                debug_log(f"Using get_iplayer entrypoint from installer path: {resolved}")
+                debug.log(f"Using get_iplayer entrypoint from installer path: {resolved}")
                 return resolved
     resolved = candidates[0]
-    debug_log(f"Fallback get_iplayer entrypoint: {resolved}")
+    debug.log(f"Fallback get_iplayer entrypoint: {resolved}")
     return resolved
 
 
-@lru_cache(maxsize=1)
+@cache
 def get_iplayer_invocation() -> Tuple[str, ...]:
     entrypoint = resolve_get_iplayer_entrypoint()
     if os.name == "nt":
@@ -58,10 +58,10 @@ def get_iplayer_invocation() -> Tuple[str, ...]:
         if lowered.endswith((".cmd", ".bat")):
             comspec = os.environ.get("COMSPEC", "cmd.exe")
             invocation = (comspec, "/c", entrypoint)
-            debug_log(f"get_iplayer invocation via COMSPEC: {format_command(invocation)}")
+            debug.log(f"get_iplayer invocation via COMSPEC: {format_command(invocation)}")
             return invocation
     invocation = (entrypoint,)
-    debug_log(f"get_iplayer invocation: {format_command(invocation)}")
+    debug.log(f"get_iplayer invocation: {format_command(invocation)}")
     return invocation
 
 
@@ -2,18 +2,29 @@
 
 from __future__ import annotations
 
+import json
+import os
 import re
+import sqlite3
 import subprocess
-from typing import Dict, Iterable
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Dict, Iterable, Sequence, TypeVar
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
-from .debug import debug_log
+from .. import __version__
+from . import debug
 from importlib import import_module
 
 from .iplayer import get_iplayer_invocation
-from .pids import PID_PATTERN, normalise_pid
+from .pids import is_pid, normalise_pid
 from .utils import (
+    LRUCache,
     dedupe_preserve_order,
     extract_broadcast_date,
     format_command,
@@ -23,10 +34,100 @@ from .utils import (
     two_digit,
 )
 
-PID_METADATA: Dict[str, Dict[str, str]] = {}
+# Bounded so long batch sessions do not hold metadata for every PID ever seen.
+METADATA_CACHE_SIZE = 8192
+
+PID_METADATA: LRUCache[str, Dict[str, str]] = LRUCache(METADATA_CACHE_SIZE)
+
+# Labels keyed by PID, stored with the metadata they were built from so a refreshed
+# metadata entry invalidates the label.
+_PROGRAM_LABELS: LRUCache[str, tuple[Dict[str, str], str]] = LRUCache(1024)
+
+# Episode payloads fetched during PID expansion, held until their metadata is built
+# so the same programme JSON is not downloaded and decoded a second time.
+_EPISODE_PAYLOADS: LRUCache[str, dict] = LRUCache(1024)
 
 PROGRAM_LABEL_WIDTH = 42
 
+SPECIALS_PATTERN = re.compile(r"\bspecials?\b", re.IGNORECASE)
+# One match per relevant line of get_iplayer's recursive listing: either an "Episodes:"
+# section marker or the first PID on a line that is not an "INFO:" message. The leading
+# whitespace is possessive so an indented "INFO:" line cannot slip past the lookahead.
+GET_IPLAYER_LISTING_PATTERN = re.compile(
+    rb"^[ \t\f\v]*+(?:(Episodes:)|(?!INFO:)[^\r\n]*?\b([a-z][a-z0-9]{7,10})\b)", re.MULTILINE
+)
+
+# Connections the shared session keeps, and the cap on concurrent expansion requests.
+HTTP_POOL_SIZE = 16
+
+# Upper bound on concurrent series lookups while expanding a brand.
+SERIES_EXPANSION_WORKERS = 8
+
+# Upper bound on concurrent children page requests, and a safety cap on page count.
+CHILDREN_PAGE_WORKERS = 8
+CHILDREN_PAGE_LIMIT = 1000
+
+# Ceiling on one batched get_iplayer expansion, however many PIDs it covers.
+BATCH_EXPANSION_TIMEOUT = 600
+
+METADATA_CACHE_TTL = 30 * 24 * 60 * 60
+
+# One pooled session keeps connections to the BBC alive across metadata and
+# expansion requests instead of paying a TCP and TLS handshake for each call.
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = f"auntie/{__version__}"
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False,
+        ),
+    ),
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Threads shared by every nested expansion pool, so together they stay within the pool.
+_http_workers_free = HTTP_POOL_SIZE
+_http_workers_lock = threading.Lock()
+
+
+def map_http(fn: Callable[[T], R], items: Sequence[T], max_workers: int) -> list[R]:
+    """Return ``[fn(item) for item in items]``, spread over spare HTTP workers if any."""
+    global _http_workers_free
+    with _http_workers_lock:
+        workers = min(max_workers, len(items), _http_workers_free)
+        if workers < 2:
+            workers = 0
+        _http_workers_free -= workers
+    if not workers:
+        return [fn(item) for item in items]
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fn, items))
+    finally:
+        with _http_workers_lock:
+            _http_workers_free += workers
+
+
+_metadata_db: sqlite3.Connection | None = None
+_cli_module: ModuleType | None = None
+_metadata_db_failed = False
+_metadata_db_lock = threading.Lock()
+
+
+def _text(value: object) -> str:
+    """Same as ``str(value or "")``, but returns strings as they are."""
+    if isinstance(value, str):
+        return value
+    return str(value) if value else ""
+
 
 def bbc_metadata_from_pid(pid: str, timeout: int = 10) -> Dict[str, str]:
     """
@@ -39,60 +140,60 @@ def bbc_metadata_from_pid(pid: str, timeout: int = 10) -> Dict[str, str]:
     }
     """
 
-    specials_regex = re.compile(r"\bspecials?\b", re.IGNORECASE)
-
-    url = f"https://www.bbc.co.uk/programmes/{pid}.json"
-    response = requests.get(url, timeout=timeout)
-    response.raise_for_status()
-    data = response.json()
+    data = _EPISODE_PAYLOADS.pop(pid, None) or fetch_programme_json(pid, timeout)
     prog = data.get("programme") or {}
 
-    episode_title = str(prog.get("title") or "")
+    episode_title = _text(prog.get("title"))
     episode_pos = prog.get("position") if prog.get("type") == "episode" else None
     display_subtitle = ""
-    if isinstance(prog.get("display_title"), dict):
-        display_subtitle = str(prog["display_title"].get("subtitle") or "")
+    display_title = prog.get("display_title")
+    if isinstance(display_title, dict):
+        display_subtitle = _text(display_title.get("subtitle"))
 
-    node = prog
     brand_title = ""
     series_title = ""
     series_pos = None
-    ancestor_titles = []
-
-    while isinstance(node, dict) and isinstance(node.get("parent"), dict):
-        parent_prog = node["parent"].get("programme")
+    season_str = ""
+    # Ancestor titles only feed the specials fallback, so stop collecting them once a
+    # usable series position has been found.
+    ancestor_titles: list[str] = []
+
+    parent = prog.get("parent")
+    while isinstance(parent, dict):
+        parent_prog = parent.get("programme")
         if not isinstance(parent_prog, dict):
             break
 
         ptype = parent_prog.get("type")
-        ptitle = parent_prog.get("title")
-        if isinstance(ptitle, str) and ptitle:
-            ancestor_titles.append(ptitle)
+        if not season_str:
+            ptitle = parent_prog.get("title")
+            if isinstance(ptitle, str) and ptitle:
+                ancestor_titles.append(ptitle)
 
         if ptype == "series":
             if series_pos is None:
                 series_pos = parent_prog.get("position")
+                season_str = safe_int_to_str(series_pos)
             if not series_title:
-                series_title = str(parent_prog.get("title") or "")
+                series_title = _text(parent_prog.get("title"))
         elif ptype == "brand":
             if not brand_title:
-                brand_title = str(parent_prog.get("title") or "")
+                brand_title = _text(parent_prog.get("title"))
             break
 
-        node = parent_prog
+        parent = parent_prog.get("parent")
 
     if not brand_title and prog.get("type") == "brand":
-        brand_title = str(prog.get("title") or "")
+        brand_title = _text(prog.get("title"))
 
-    season_str = safe_int_to_str(series_pos)
     if not season_str:
         specials_hints = []
         if series_title:
             specials_hints.append(series_title)
         if display_subtitle:
             specials_hints.append(display_subtitle.split(",", 1)[0].strip())
-        specials_hints.extend(t for t in ancestor_titles if isinstance(t, str))
-        if any(specials_regex.search(t or "") for t in specials_hints):
+        specials_hints.extend(ancestor_titles)
+        if any(SPECIALS_PATTERN.search(t or "") for t in specials_hints):
             season_str = "0"
 
     ep_str = safe_int_to_str(episode_pos)
@@ -100,26 +201,101 @@ def bbc_metadata_from_pid(pid: str, timeout: int = 10) -> Dict[str, str]:
         ep_str = extract_broadcast_date(prog)
 
     return {
-        "show_title": str(brand_title or ""),
+        "show_title": brand_title,
         "season_number": season_str,
         "episode_number": ep_str,
         "episode_title": episode_title,
     }
 
 
+def metadata_cache_path() -> Path:
+    """Return the location of the on-disk metadata cache."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "auntie" / "metadata.sqlite"
+
+
+def _metadata_db_connection() -> sqlite3.Connection | None:
+    global _metadata_db, _metadata_db_failed
+    if _metadata_db is None and not _metadata_db_failed:
+        path = metadata_cache_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(path, timeout=5, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS metadata "
+                "(pid TEXT PRIMARY KEY, json BLOB NOT NULL, fetched_at INTEGER NOT NULL)"
+            )
+            connection.commit()
+        except (OSError, sqlite3.Error) as exc:
+            debug.log(f"Metadata disk cache unavailable at {path} ({exc})")
+            _metadata_db_failed = True
+        else:
+            _metadata_db = connection
+    return _metadata_db
+
+
+def _load_disk_metadata(pid: str) -> Dict[str, str] | None:
+    with _metadata_db_lock:
+        connection = _metadata_db_connection()
+        if connection is None:
+            return None
+        try:
+            row = connection.execute(
+                "SELECT json, fetched_at FROM metadata WHERE pid = ?", (pid,)
+            ).fetchone()
+        except sqlite3.Error as exc:
+            debug.log(f"{pid}: metadata disk cache read failed ({exc})")
+            return None
+    if row is None or time.time() - row[1] > METADATA_CACHE_TTL:
+        return None
+    try:
+        metadata = json.loads(row[0])
+    except ValueError:
+        return None
+    return metadata if isinstance(metadata, dict) else None
+
+
+def _store_disk_metadata(pid: str, metadata: Dict[str, str]) -> None:
+    with _metadata_db_lock:
+        connection = _metadata_db_connection()
+        if connection is None:
+            return
+        try:
+            connection.execute(
+                "INSERT OR REPLACE INTO metadata (pid, json, fetched_at) VALUES (?, ?, ?)",
+                (pid, json.dumps(metadata), int(time.time())),
+            )
+            connection.commit()
+        except sqlite3.Error as exc:
+            debug.log(f"{pid}: metadata disk cache write failed ({exc})")
+
+
 def get_cached_metadata(pid: str) -> Dict[str, str]:
+    """Return metadata for *pid* from memory, then the disk cache, then the BBC API."""
     metadata = PID_METADATA.get(pid)
     if metadata is None:
-        try:
-            metadata = bbc_metadata_from_pid(pid)
-        except Exception:
-            metadata = {}
+        metadata = _load_disk_metadata(pid)
+        if metadata is None:
+            try:
+                metadata = bbc_metadata_from_pid(pid)
+            except Exception:
+                metadata = {}
+            else:
+                # Only successful lookups are persisted so an offline run cannot
+                # poison the cache for later ones.
+                _store_disk_metadata(pid, metadata)
         PID_METADATA[pid] = metadata
+    # A cache hit never consumes the payload held from expansion, so release it here.
+    _EPISODE_PAYLOADS.pop(pid, None)
     return metadata
 
 
 def build_program_label(pid: str) -> str:
     metadata = get_cached_metadata(pid)
+    cached = _PROGRAM_LABELS.get(pid)
+    if cached is not None and cached[0] is metadata:
+        return cached[1]
     show = truncate_title(metadata.get("show_title", ""))
     episode = truncate_title(metadata.get("episode_title", ""))
     season_number = two_digit(metadata.get("season_number"))
@@ -130,6 +306,7 @@ def build_program_label(pid: str) -> str:
         base = base.ljust(PROGRAM_LABEL_WIDTH)
     elif len(base) > PROGRAM_LABEL_WIDTH:
         base = base[:PROGRAM_LABEL_WIDTH]
+    _PROGRAM_LABELS[pid] = (metadata, base)
     return base
 
 
@@ -155,8 +332,8 @@ def format_plex_filename(metadata: Dict[str, str], pid: str, extension: str) ->
 
 def fetch_programme_json(pid: str, timeout: int) -> dict:
     url = f"https://www.bbc.co.uk/programmes/{pid}.json"
-    debug_log(f"{pid}: fetching programme JSON via {url}")
-    response = requests.get(url, timeout=timeout)
+    debug.log(f"{pid}: fetching programme JSON via {url}")
+    response = _SESSION.get(url, timeout=timeout)
     response.raise_for_status()
     payload = response.json()
     if not isinstance(payload, dict):
@@ -164,156 +341,222 @@ def fetch_programme_json(pid: str, timeout: int) -> dict:
     return payload
 
 
+def _fetch_children_page(pid: str, page: int, timeout: int) -> tuple[list[dict], int | None] | None:
+    """Return one page of children and the reported total, or ``None`` if it is missing."""
+    url = f"https://www.bbc.co.uk/programmes/{pid}/children.json?page={page}"
+    debug.log(f"{pid}: fetching children page {page} via {url}")
+    response = _SESSION.get(url, timeout=timeout)
+    if response.status_code == 404:
+        debug.log(f"{pid}: children page {page} returned 404; stopping pagination")
+        return None
+    response.raise_for_status()
+    payload = response.json()
+    if not isinstance(payload, dict):
+        raise ValueError("children payload is not an object")
+    children = payload.get("children")
+    if not isinstance(children, dict):
+        debug.log(f"{pid}: children page {page} missing 'children' key")
+        return None
+    page_programmes = [
+        item for item in (children.get("programmes") or []) if isinstance(item, dict)
+    ]
+    debug.log(f"{pid}: children page {page} returned {len(page_programmes)} programmes")
+    total = children.get("total")
+    try:
+        total_int = int(total) if total is not None else None
+    except (TypeError, ValueError):
+        total_int = None
+    return page_programmes, total_int
+
+
 def fetch_children_programmes(pid: str, timeout: int) -> list[dict]:
-    programmes: list[dict] = []
+    first = _fetch_children_page(pid, 1, timeout)
+    if first is None:
+        return []
+    programmes, total_int = first
+    per_page = len(programmes)
+
+    if total_int is not None and per_page and total_int > per_page:
+        # The first page reports the total, so the remaining pages can be requested
+        # together; map() hands them back in page order.
+        last_page = min(-(-total_int // per_page), CHILDREN_PAGE_LIMIT)
+        pages = range(2, last_page + 1)
+        results = map_http(
+            lambda page: _fetch_children_page(pid, page, timeout), pages, CHILDREN_PAGE_WORKERS
+        )
+        for result in results:
+            if result is None or not result[0]:
+                break
+            programmes.extend(result[0])
+        debug.log(f"{pid}: collected {len(programmes)} programmes across children pages")
+        return programmes
+
+    # Without a usable total, walk the pages one at a time until they run out.
     page = 1
-    base_url = f"https://www.bbc.co.uk/programmes/{pid}/children.json"
     while True:
-        url = f"{base_url}?page={page}"
-        debug_log(f"{pid}: fetching children page {page} via {url}")
-        response = requests.get(url, timeout=timeout)
-        if response.status_code == 404:
-            debug_log(f"{pid}: children page {page} returned 404; stopping pagination")
-            break
-        response.raise_for_status()
-        payload = response.json()
-        if not isinstance(payload, dict):
-            raise ValueError("children payload is not an object")
-        children = payload.get("children")
-        if not isinstance(children, dict):
-            debug_log(f"{pid}: children page {page} missing 'children' key")
-            break
-        page_programmes = [
-            item for item in (children.get("programmes") or []) if isinstance(item, dict)
-        ]
-        debug_log(f"{pid}: children page {page} returned {len(page_programmes)} programmes")
-        programmes.extend(page_programmes)
-        total = children.get("total")
-        try:
-            total_int = int(total) if total is not None else None
-        except (TypeError, ValueError):
-            total_int = None
         if total_int is not None and len(programmes) >= total_int:
-            debug_log(f"{pid}: collected {len(programmes)} programmes across children pages")
+            debug.log(f"{pid}: collected {len(programmes)} programmes across children pages")
             break
-        if not page_programmes:
-            debug_log(f"{pid}: no programmes found on children page {page}; stopping")
+        if not per_page:
+            debug.log(f"{pid}: no programmes found on children page {page}; stopping")
             break
         page += 1
-        if page > 1000:
-            debug_log(f"{pid}: reached pagination safety limit while fetching children")
+        if page > CHILDREN_PAGE_LIMIT:
+            debug.log(f"{pid}: reached pagination safety limit while fetching children")
+            break
+        result = _fetch_children_page(pid, page, timeout)
+        if result is None:
             break
+        page_programmes, total_int = result
+        per_page = len(page_programmes)
+        programmes.extend(page_programmes)
     return programmes
 
 
-def _episode_pids_from_programmes(programmes: Iterable[dict]) -> list[str]:
+def _partition_programmes(programmes: Iterable[dict]) -> tuple[list[str], list[str]]:
+    """Split child programmes into episode and (deduplicated) series PIDs in one pass."""
     episode_pids: list[str] = []
-    for item in programmes:
-        if not isinstance(item, dict):
-            continue
-        if item.get("type") != "episode":
-            continue
-        candidate = item.get("pid")
-        if isinstance(candidate, str) and PID_PATTERN.fullmatch(candidate):
-            episode_pids.append(candidate.lower())
-    return episode_pids
-
-
-def _series_pids_from_programmes(programmes: Iterable[dict]) -> list[str]:
     series_pids: list[str] = []
     for item in programmes:
         if not isinstance(item, dict):
             continue
-        if item.get("type") != "series":
+        programme_type = item.get("type")
+        if programme_type == "episode":
+            target = episode_pids
+        elif programme_type == "series":
+            target = series_pids
+        else:
             continue
         candidate = item.get("pid")
-        if isinstance(candidate, str) and PID_PATTERN.fullmatch(candidate):
-            series_pids.append(candidate.lower())
-    return dedupe_preserve_order(series_pids)
+        if isinstance(candidate, str):
+            # Lowercase once and validate the result that is kept.
+            candidate = candidate.lower()
+            if is_pid(candidate):
+                target.append(candidate)
+    return episode_pids, dedupe_preserve_order(series_pids)
 
 
 def _api_expand_series(pid: str, timeout: int) -> list[str]:
-    programmes = fetch_children_programmes(pid, timeout)
-    episode_pids = _episode_pids_from_programmes(programmes)
-    debug_log(f"{pid}: API series expansion found {len(episode_pids)} episode(s)")
+    episode_pids, _ = _partition_programmes(fetch_children_programmes(pid, timeout))
+    debug.log(f"{pid}: API series expansion found {len(episode_pids)} episode(s)")
     return dedupe_preserve_order(episode_pids)
 
 
 def _api_expand_brand(pid: str, timeout: int) -> list[str]:
-    programmes = fetch_children_programmes(pid, timeout)
-    episode_pids = _episode_pids_from_programmes(programmes)
-    series_pids = _series_pids_from_programmes(programmes)
-    debug_log(
+    episode_pids, series_pids = _partition_programmes(fetch_children_programmes(pid, timeout))
+    debug.log(
         f"{pid}: API brand expansion has {len(series_pids)} series child(ren) "
         f"and {len(episode_pids)} direct episode(s)"
     )
-    for series_pid in series_pids:
-        series_episodes = _api_expand_series(series_pid, timeout)
-        debug_log(
-            f"{pid}: series {series_pid} contributed {len(series_episodes)} episode(s) via API"
+    if series_pids:
+        series_results = map_http(
+            lambda series_pid: _api_expand_series(series_pid, timeout),
+            series_pids,
+            SERIES_EXPANSION_WORKERS,
         )
-        episode_pids.extend(series_episodes)
+        for series_pid, series_episodes in zip(series_pids, series_results):
+            debug.log(
+                f"{pid}: series {series_pid} contributed {len(series_episodes)} episode(s) via API"
+            )
+            episode_pids.extend(series_episodes)
     return dedupe_preserve_order(episode_pids)
 
 
-def get_bbc_episode_pids(pid: str, timeout: int = 120) -> list[str]:
+def get_bbc_episode_pids(pid: str, timeout: int = 120, *, fallback: bool = True) -> list[str]:
+    """Return the episode PIDs for *pid* via the programmes API.
+
+    When the API cannot resolve the PID, get_iplayer's recursive listing is used
+    instead, unless *fallback* is false, in which case an empty list is returned so
+    the caller can batch the fallback for several PIDs at once.
+    """
     pid = normalise_pid(pid)
     try:
         programme_payload = fetch_programme_json(pid, timeout)
     except requests.RequestException as exc:
-        debug_log(f"{pid}: failed to fetch programme metadata via API ({exc})")
+        debug.log(f"{pid}: failed to fetch programme metadata via API ({exc})")
     except ValueError as exc:
-        debug_log(f"{pid}: invalid programme payload via API ({exc})")
+        debug.log(f"{pid}: invalid programme payload via API ({exc})")
     else:
         programme = programme_payload.get("programme")
         if isinstance(programme, dict):
             programme_type = programme.get("type")
-            debug_log(f"{pid}: programme.type from API is '{programme_type}'")
+            debug.log(f"{pid}: programme.type from API is '{programme_type}'")
             if programme_type == "episode":
-                debug_log(f"{pid}: programme is an episode; returning PID directly")
+                debug.log(f"{pid}: programme is an episode; returning PID directly")
+                _EPISODE_PAYLOADS[pid] = programme_payload
                 return [pid]
             if programme_type == "series":
                 try:
                     series_pids = _api_expand_series(pid, timeout)
                 except requests.RequestException as exc:
-                    debug_log(f"{pid}: failed to expand series via API ({exc})")
+                    debug.log(f"{pid}: failed to expand series via API ({exc})")
                 except ValueError as exc:
-                    debug_log(f"{pid}: invalid series children payload via API ({exc})")
+                    debug.log(f"{pid}: invalid series children payload via API ({exc})")
                 else:
                     if series_pids:
-                        debug_log(
+                        debug.log(
                             f"{pid}: API series expansion succeeded with {len(series_pids)} PID(s)"
                         )
                         return series_pids
-                    debug_log(f"{pid}: API series expansion returned no PIDs")
+                    debug.log(f"{pid}: API series expansion returned no PIDs")
             elif programme_type == "brand":
                 try:
                     brand_pids = _api_expand_brand(pid, timeout)
                 except requests.RequestException as exc:
-                    debug_log(f"{pid}: failed to expand brand via API ({exc})")
+                    debug.log(f"{pid}: failed to expand brand via API ({exc})")
                 except ValueError as exc:
-                    debug_log(f"{pid}: invalid brand children payload via API ({exc})")
+                    debug.log(f"{pid}: invalid brand children payload via API ({exc})")
                 else:
                     if brand_pids:
-                        debug_log(
+                        debug.log(
                             f"{pid}: API brand expansion succeeded with {len(brand_pids)} PID(s)"
                         )
                         return brand_pids
-                    debug_log(f"{pid}: API brand expansion returned no PIDs")
+                    debug.log(f"{pid}: API brand expansion returned no PIDs")
             else:
-                debug_log(f"{pid}: API payload missing 'programme' object")
-    debug_log(f"{pid}: falling back to get_iplayer PID expansion")
-    try:
-        cli_module = import_module("auntie.cli")
-    except Exception:
-        fallback = _get_bbc_episode_pids_via_get_iplayer_impl
-    else:
-        fallback = getattr(
-            cli_module,
-            "_get_bbc_episode_pids_via_get_iplayer",
-            _get_bbc_episode_pids_via_get_iplayer_impl,
-        )
-    return fallback(pid, timeout)
+                debug.log(f"{pid}: API payload missing 'programme' object")
+    if not fallback:
+        debug.log(f"{pid}: API could not expand PID; leaving get_iplayer fallback to caller")
+        return []
+    debug.log(f"{pid}: falling back to get_iplayer PID expansion")
+    return _get_iplayer_fallback()(pid, timeout)
+
+
+def _get_iplayer_fallback() -> Callable[[str, int], list[str]]:
+    # The package is imported once; the attribute itself is read on every call so a
+    # replacement installed on auntie.cli (e.g. by tests) still takes effect.
+    global _cli_module
+    if _cli_module is None:
+        try:
+            _cli_module = import_module("auntie.cli")
+        except Exception:
+            return _get_bbc_episode_pids_via_get_iplayer_impl
+    return getattr(
+        _cli_module,
+        "_get_bbc_episode_pids_via_get_iplayer",
+        _get_bbc_episode_pids_via_get_iplayer_impl,
+    )
+
+
+def _parse_episode_sections(stdout: bytes) -> list[list[str]]:
+    """Return the PIDs listed under each "Episodes:" heading, in one regex sweep."""
+    sections: list[list[str]] = []
+    for marker, pid in GET_IPLAYER_LISTING_PATTERN.findall(stdout):
+        if marker:
+            sections.append([])
+        elif sections:
+            sections[-1].append(pid.decode("ascii"))
+    return sections
+
+
+def _log_command_output(label: str, result: subprocess.CompletedProcess) -> None:
+    # Output is captured as bytes and only decoded when it is actually logged.
+    if not debug.DEBUG_ENABLED:
+        return
+    for stream_name, output in (("stdout", result.stdout), ("stderr", result.stderr)):
+        if output:
+            text = output.decode("utf-8", errors="replace").strip()
+            debug.log(f"{label} {stream_name}:\n{text or '<empty>'}")
 
 
 def _get_bbc_episode_pids_via_get_iplayer_impl(pid: str, timeout: int = 120) -> list[str]:
@@ -328,43 +571,73 @@ def _get_bbc_episode_pids_via_get_iplayer_impl(pid: str, timeout: int = 120) ->
         "--pid-recursive-list",
     ]
 
-    debug_log(f"Expanding PID {pid} with command: {format_command(cmd)}")
+    debug.log(f"Expanding PID {pid} with command: {format_command(cmd)}")
 
     result = subprocess.run(
         cmd,
         capture_output=True,
-        text=True,
+        text=False,
         timeout=timeout,
     )
 
-    debug_log(f"PID expansion command exited with code {result.returncode}")
-    if result.stdout:
-        debug_log(f"PID expansion stdout:\n{result.stdout.strip() or '<empty>'}")
-    if result.stderr:
-        debug_log(f"PID expansion stderr:\n{result.stderr.strip() or '<empty>'}")
+    debug.log(f"PID expansion command exited with code {result.returncode}")
+    _log_command_output("PID expansion", result)
 
-    pid_pattern = re.compile(r"\b[a-z][a-z0-9]{7,10}\b")
+    pids = [
+        episode_pid for section in _parse_episode_sections(result.stdout) for episode_pid in section
+    ]
 
-    pids = []
-    collecting = False
-    for line in result.stdout.splitlines():
-        line = line.strip()
+    debug.log(f"PID expansion result for {pid}: {pids or '[no matches]'}")
 
-        if not collecting:
-            if line.startswith("Episodes:"):
-                collecting = True
-            continue
+    return pids
 
-        if not line or line.startswith("INFO:"):
-            continue
 
-        match = pid_pattern.search(line)
-        if match:
-            pids.append(match.group(0))
+def get_bbc_episode_pids_via_get_iplayer_batch(
+    pids: Sequence[str], timeout: int = 120
+) -> dict[str, list[str]]:
+    """
+    Expand several PIDs with a single get_iplayer invocation.
 
-    debug_log(f"PID expansion result for {pid}: {pids or '[no matches]'}")
+    get_iplayer prints one "Episodes:" section per requested PID, in the order the
+    ``--pid`` options were given. If the sections cannot be matched up with the
+    PIDs, each PID is expanded on its own instead.
+    """
+    fallback = _get_iplayer_fallback()
+    if len(pids) <= 1 or fallback is not _get_bbc_episode_pids_via_get_iplayer_impl:
+        # A replaced single-PID expander (e.g. in tests) takes precedence over batching.
+        return {pid: fallback(pid, timeout) for pid in pids}
 
-    return pids
+    base_command = list(get_iplayer_invocation())
+    cmd = [
+        *base_command,
+        "--pid-recursive-list",
+        *(f"--pid={pid}" for pid in pids),
+    ]
+
+    debug.log(f"Expanding {len(pids)} PIDs with command: {format_command(cmd)}")
+
+    result = subprocess.run(
+        cmd,
+        capture_output=True,
+        text=False,
+        timeout=min(timeout * len(pids), BATCH_EXPANSION_TIMEOUT),
+    )
+
+    debug.log(f"Batch PID expansion command exited with code {result.returncode}")
+    _log_command_output("Batch PID expansion", result)
+
+    sections = _parse_episode_sections(result.stdout)
+    if len(sections) != len(pids):
+        debug.log(
+            f"Batch PID expansion returned {len(sections)} section(s) for {len(pids)} PID(s); "
+            "expanding individually"
+        )
+        return {pid: fallback(pid, timeout) for pid in pids}
+
+    expanded = dict(zip(pids, sections))
+    for pid, episode_pids in expanded.items():
+        debug.log(f"PID expansion result for {pid}: {episode_pids or '[no matches]'}")
+    return expanded
 
 
 _get_bbc_episode_pids_via_get_iplayer = _get_bbc_episode_pids_via_get_iplayer_impl
@@ -377,5 +650,8 @@ __all__ = [
     "build_program_label",
     "format_plex_filename",
     "get_bbc_episode_pids",
+    "get_bbc_episode_pids_via_get_iplayer_batch",
     "get_cached_metadata",
+    "map_http",
+    "metadata_cache_path",
 ]
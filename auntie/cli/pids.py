@@ -4,19 +4,44 @@ from __future__ import annotations
 
 import re
 
-from .debug import debug_log
+from . import debug
 
-PID_PATTERN = re.compile(r"([a-z][b-df-hj-np-tv-z0-9]{7,10})", re.IGNORECASE)
+# ASCII-only: PIDs never contain anything else, and without re.ASCII, IGNORECASE would
+# also let "ſ" (long s) and the Kelvin sign match the letter classes.
+PID_PATTERN = re.compile(r"([a-z][b-df-hj-np-tv-z0-9]{7,10})", re.IGNORECASE | re.ASCII)
+_HAS_DIGIT = re.compile(r"[0-9]").search
+
+# Deletion table for the characters PID_PATTERN allows after the leading letter; a
+# candidate tail that translates to an empty string is made only of those characters.
+_PID_TAIL_CHARS = "bcdfghjklmnpqrstvwxyz0123456789"
+_PID_TAIL_DELETE = str.maketrans("", "", _PID_TAIL_CHARS + _PID_TAIL_CHARS.upper())
 
 BBC_IPLAYER_SINGLE_EPISODE_PREFIX = "https://www.bbc.co.uk/iplayer/episode/"
 BBC_IPLAYER_SERIES_BRAND_PREFIX = "https://www.bbc.co.uk/iplayer/episodes/"
 
 
+def is_pid(candidate: str) -> bool:
+    """Equivalent to ``PID_PATTERN.fullmatch(candidate)`` without entering the regex engine."""
+    return (
+        8 <= len(candidate) <= 11
+        and candidate[0].isascii()
+        and candidate[0].isalpha()
+        and not candidate[1:].translate(_PID_TAIL_DELETE)
+    )
+
+
 def normalise_pid(value: str) -> str:
     trimmed = (value or "").strip()
     if not trimmed:
         return ""
 
+    # Expanded episode PIDs and most arguments are already bare PIDs, which the generic
+    # parsing below would return unchanged apart from case.
+    if is_pid(trimmed):
+        result = trimmed.lower()
+        debug.log(f"Using PID '{result}' as given")
+        return result
+
     lowered = trimmed.lower()
 
     if lowered.startswith(BBC_IPLAYER_SINGLE_EPISODE_PREFIX):
@@ -25,15 +50,15 @@ def normalise_pid(value: str) -> str:
         candidate = candidate.split("?", 1)[0]
         candidate = candidate.split("#", 1)[0]
         candidate = candidate.strip()
-        debug_log(
+        debug.log(
             f"Normalising PID from single episode URL '{trimmed}'; "
             f"extracted candidate '{candidate or '<empty>'}'"
         )
-        if candidate and PID_PATTERN.fullmatch(candidate):
-            result = candidate.lower()
-            debug_log(f"Using PID '{result}' from single episode URL")
+        result = candidate.lower()
+        if is_pid(result):
+            debug.log(f"Using PID '{result}' from single episode URL")
             return result
-        debug_log(
+        debug.log(
             "No valid PID immediately after single episode URL prefix; "
             "falling back to generic parsing"
         )
@@ -41,31 +66,31 @@ def normalise_pid(value: str) -> str:
     matches = PID_PATTERN.findall(trimmed)
     if matches:
         if lowered.startswith(BBC_IPLAYER_SERIES_BRAND_PREFIX):
-            debug_log(f"Normalising PID from series/brand URL '{trimmed}'; candidates={matches}")
+            debug.log(f"Normalising PID from series/brand URL '{trimmed}'; candidates={matches}")
             for candidate in reversed(matches):
-                if any(ch.isdigit() for ch in candidate):
+                if _HAS_DIGIT(candidate):
                     result = candidate.lower()
-                    debug_log(f"Using PID '{result}' from series/brand URL")
+                    debug.log(f"Using PID '{result}' from series/brand URL")
                     return result
             result = matches[-1].lower()
-            debug_log(
+            debug.log(
                 f"No candidate with digits in series/brand URL; defaulting to last PID '{result}'"
             )
             return result
 
         for candidate in reversed(matches):
-            if any(ch.isdigit() for ch in candidate):
+            if _HAS_DIGIT(candidate):
                 result = candidate.lower()
-                debug_log(f"Using PID '{result}' from matches {matches}")
+                debug.log(f"Using PID '{result}' from matches {matches}")
                 return result
         result = matches[-1].lower()
-        debug_log(
+        debug.log(
             f"No candidate with digits found; defaulting to last PID '{result}' from matches {matches}"
         )
         return result
 
     result = trimmed.lower()
-    debug_log(f"No PID match found; returning stripped value '{result}'")
+    debug.log(f"No PID match found; returning stripped value '{result}'")
     return result
 
 
@@ -73,5 +98,6 @@ __all__ = [
     "BBC_IPLAYER_SERIES_BRAND_PREFIX",
     "BBC_IPLAYER_SINGLE_EPISODE_PREFIX",
     "PID_PATTERN",
+    "is_pid",
     "normalise_pid",
 ]
@@ -5,22 +5,32 @@ from __future__ import annotations
 import re
 import threading
 import time
-from typing import Dict
+from bisect import bisect_left
+from typing import Dict, Iterable
 
 from tqdm import tqdm
 
-from .colours import RESET, ColourStyle
+from .colours import ColourStyle
 from .metadata import PROGRAM_LABEL_WIDTH
 
+# Negated classes and possessive quantifiers keep the per-line match from backtracking.
 PROGRESS_LINE = re.compile(
-    r"^\s*(?P<percent>\d+(?:\.\d+)?)%.*?@\s*(?P<speed>.*?)\s+ETA:\s*(?P<eta>\S+).*?\[(?P<stream>[^\]]+)\]\s*$",
+    r"^\s*+(?P<percent>\d++(?:\.\d++)?+)%[^@\n]*+@\s*(?P<speed>.*?)\s+ETA:\s*(?P<eta>\S+)"
+    r"[^\[\n]*+.*?\[(?P<stream>[^\]]+)\]\s*$",
     re.IGNORECASE,
 )
 COMPLETED_LINE = re.compile(
-    r"INFO:\s+Downloaded:.*?@\s*(?P<speed>.*?)\s*\([^)]*\)\s*\[(?P<stream>[^\]]+)\]",
+    r"INFO:\s+Downloaded:[^@\n]*@\s*(?P<speed>.*?)\s*\([^)]*\)\s*\[(?P<stream>[^\]]+)\]",
     re.IGNORECASE,
 )
 
+CONVERTING_LINE = re.compile(r"converting|tagging", re.IGNORECASE)
+
+# Bound methods for the per-line hot path in emit_progress_lines.
+_progress_match = PROGRESS_LINE.match
+_completed_search = COMPLETED_LINE.search
+_converting_search = CONVERTING_LINE.search
+
 STREAM_PRIORITY = ("waiting", "audio", "audio+video", "video", "converting")
 
 DEFAULT_SPEED = "--.- Mb/s"
@@ -29,23 +39,84 @@ ETA_FIELD_WIDTH = 8
 SPEED_FIELD_WIDTH = 10
 META_WIDTH = 5 + ETA_FIELD_WIDTH + 2 + SPEED_FIELD_WIDTH + 1
 STREAM_FIELD_WIDTH = 12
-PSEUDO_STREAMS = {"waiting", "converting"}
+PSEUDO_STREAMS = frozenset({"waiting", "converting"})
 PERCENT_WIDTH = 8
+HEARTBEAT_INTERVAL = 0.25
+BLANK_PERCENT = " " * PERCENT_WIDTH
+BLANK_META = " " * META_WIDTH
+COMPLETED_META = "(completed)".ljust(META_WIDTH)
+PAINT_INTERVAL = 0.1
+
+
+# Sort keys for the stream names seen so far; get_iplayer only reports a handful.
+_STREAM_SORT_KEYS: Dict[str, tuple[int, int, str]] = {}
+
+
+def _stream_sort_key(stream: str) -> tuple[int, int, str]:
+    sort_key = _STREAM_SORT_KEYS.get(stream)
+    if sort_key is not None:
+        return sort_key
+    sort_key = (1, 0, stream)
+    for index, name in enumerate(STREAM_PRIORITY):
+        if stream.startswith(name):
+            sort_key = (0, index, stream)
+            break
+    _STREAM_SORT_KEYS[stream] = sort_key
+    return sort_key
+
+
+# Padded description columns, cached as plain dicts since they are only touched under the lock.
+FIELD_CACHE_LIMIT = 4096
+_STREAM_FIELDS: Dict[str, str] = {}
+_PERCENT_FIELDS: Dict[float, str] = {}
+_META_FIELDS: Dict[tuple[str | None, str | None], str] = {}
+
+
+def _stream_field(stream: str) -> str:
+    field = _STREAM_FIELDS.get(stream)
+    if field is None:
+        field = _STREAM_FIELDS[stream] = stream[:STREAM_FIELD_WIDTH].ljust(STREAM_FIELD_WIDTH)
+    return field
+
+
+def _percent_field(value: float) -> str:
+    # get_iplayer reports percent to one decimal place, so at most ~1001 values recur.
+    field = _PERCENT_FIELDS.get(value)
+    if field is None:
+        if len(_PERCENT_FIELDS) >= FIELD_CACHE_LIMIT:
+            _PERCENT_FIELDS.clear()
+        field = _PERCENT_FIELDS[value] = f"{value:6.1f}% "
+    return field
 
 
 class ProgressTracker:
     """Thread-safe progress bar management."""
 
     def __init__(self) -> None:
-        self._lock = threading.Lock()
+        # Re-entrant so update_stream can create a missing bar without releasing the lock
+        # it holds for the update itself.
+        self._lock = threading.RLock()
         self._bars: Dict[tuple[str, str], tqdm] = {}
+        # Bar keys in display order, kept sorted as bars are created.
+        self._ordered: list[tuple[tuple, tuple[str, str]]] = []
         self._pid_colours: Dict[str, ColourStyle] = {}
         self._completed_bars: set[tuple[str, str]] = set()
         self._stream_state: Dict[tuple[str, str], tuple[str | None, str | None, bool]] = {}
         self._pid_labels: Dict[str, str] = {}
+        self._fallback_labels: Dict[str, str] = {}
+        # What each bar's description was last built from, so unchanged updates can
+        # skip composing and setting it again.
+        self._desc_inputs: Dict[tuple[str, str], tuple] = {}
         self._pseudo_timers: Dict[tuple[str, str], Dict[str, float]] = {}
+        # Bars whose state changed since the painter thread last repainted them.
+        self._dirty: set[tuple[str, str]] = set()
+        self._painter: threading.Thread | None = None
+        self._painter_stop = threading.Event()
+        # Set while reset/finalise tear down, so nothing restarts the painter meanwhile.
+        self._stopping = False
 
     def reset(self) -> None:
+        self._stop_painter()
         with self._lock:
             for bar in self._bars.values():
                 try:
@@ -53,46 +124,81 @@ class ProgressTracker:
                 except Exception:
                     pass
             self._bars.clear()
+            self._ordered.clear()
             self._pid_colours.clear()
             self._completed_bars.clear()
             self._stream_state.clear()
             self._pseudo_timers.clear()
             self._pid_labels.clear()
+            self._fallback_labels.clear()
+            self._desc_inputs.clear()
+            self._dirty.clear()
+            self._stopping = False
 
     def register_label(self, pid: str, label: str) -> None:
         self._pid_labels[pid] = label
 
     def colour_for_pid(self, pid: str, default: ColourStyle) -> ColourStyle:
+        # A PID's colour never changes once set, so the common case is a plain dict read;
+        # only the first assignment needs the lock.
+        colour = self._pid_colours.get(pid)
+        if colour is not None:
+            return colour
         with self._lock:
             return self._pid_colours.setdefault(pid, default)
 
     def emit_progress_line(self, pid: str, default_colour: ColourStyle, text: str) -> None:
-        stripped = text.strip()
-        if not stripped:
-            return
+        self.emit_progress_lines(pid, default_colour, (text,))
 
-        lower = stripped.lower()
-        colour = self.colour_for_pid(pid, default_colour)
-        if "converting" in lower or "tagging" in lower:
-            self.start_pseudo_stream(pid, "converting", colour)
-
-        match = PROGRESS_LINE.match(stripped)
-        if not match:
-            complete_match = COMPLETED_LINE.search(stripped)
-            if not complete_match:
-                return
-            percent = 100.0
-            stream = complete_match.group("stream").strip().lower()
-            speed = complete_match.group("speed").strip()
-            eta = "00:00:00"
-        else:
-            percent = float(match.group("percent"))
-            stream = match.group("stream").strip().lower()
-            speed = match.group("speed").strip()
-            eta = match.group("eta").strip()
-            if stream not in PSEUDO_STREAMS:
-                self.complete_pseudo_stream(pid, "waiting", colour)
-        self.update_stream(pid, stream, percent, colour, speed, eta)
+    def emit_progress_lines(
+        self, pid: str, default_colour: ColourStyle, lines: Iterable[str]
+    ) -> None:
+        """Apply a batch of output lines, repainting each stream once with its latest state."""
+        colour: ColourStyle | None = None
+        latest: Dict[str, tuple[float, str, str]] = {}
+        for text in lines:
+            stripped = text.strip()
+            if not stripped:
+                continue
+            if colour is None:
+                colour = self.colour_for_pid(pid, default_colour)
+
+            if _converting_search(stripped):
+                self.start_pseudo_stream(pid, "converting", colour)
+
+            # Both patterns need a closing bracket and a progress line needs a percent
+            # sign, so most log lines are rejected by substring tests alone.
+            if "]" not in stripped:
+                continue
+            match = _progress_match(stripped) if "%" in stripped else None
+            if not match:
+                complete_match = _completed_search(stripped)
+                if not complete_match:
+                    continue
+                percent = 100.0
+                speed, stream = complete_match.groups()
+                stream = stream.strip().lower()
+                speed = speed.strip()
+                eta = "00:00:00"
+            else:
+                # One groups() call instead of four named lookups; the order follows
+                # PROGRESS_LINE.
+                percent_text, speed, eta, stream = match.groups()
+                percent = float(percent_text)
+                stream = stream.strip().lower()
+                speed = speed.strip()
+                eta = eta.strip()
+                if stream not in PSEUDO_STREAMS:
+                    self.complete_pseudo_stream(pid, "waiting", colour)
+            previous = latest.get(stream)
+            if previous is not None and (previous[0] >= 100.0 or previous[2] == "00:00:00"):
+                # A completed stream ignores later updates, so keep the completion.
+                continue
+            latest[stream] = (percent, speed, eta)
+        if colour is None:
+            return
+        for stream, (percent, speed, eta) in latest.items():
+            self.update_stream(pid, stream, percent, colour, speed, eta)
 
     def start_pseudo_stream(self, pid: str, stream: str, colour: ColourStyle) -> None:
         key = (pid, stream)
@@ -114,10 +220,10 @@ class ProgressTracker:
 
     def complete_pseudo_stream(self, pid: str, stream: str, colour: ColourStyle) -> None:
         key = (pid, stream)
-        if key not in self._pseudo_timers:
-            return
-        self._pseudo_timers.pop(key, None)
-        self.update_stream(pid, stream, 100.0, colour, None, "00:00:00")
+        with self._lock:
+            if self._pseudo_timers.pop(key, None) is None:
+                return
+            self.update_stream(pid, stream, 100.0, colour, None, "00:00:00")
 
     def mark_pid_complete(self, pid: str) -> None:
         with self._lock:
@@ -128,12 +234,8 @@ class ProgressTracker:
                     bar.n = bar.total
                 self._completed_bars.add(key)
                 self._stream_state[key] = (None, None, True)
-                bar.set_description_str(
-                    self._compose_desc(pid, key[1], bar.n, None, None, completed=True),
-                    refresh=False,
-                )
-                bar.refresh()
-            self._reassign_positions_locked()
+                self._describe_locked(key, bar, bar.n, None, None, True)
+                self._dirty.add(key)
 
     def update_stream(
         self,
@@ -148,46 +250,31 @@ class ProgressTracker:
         if key in self._completed_bars:
             return
         colour = self.colour_for_pid(pid, colour)
-        bar = self._get_progress_bar(pid, stream, colour)
-        if bar is None:
-            return
+        # One critical section per update: an existing bar is looked up under the same hold
+        # that applies the update, instead of locking once to fetch it and again to change it.
         with self._lock:
-            clamped_percent = max(0.0, min(100.0, percent))
-            increment = clamped_percent - bar.n
-            if increment < 0:
-                bar.reset(total=100.0)
-                bar.n = 0.0
-                increment = clamped_percent
-            bar.update(increment)
-            is_complete_marker = clamped_percent >= 100.0 or eta == "00:00:00"
-            bar.set_description_str(
-                self._compose_desc(
-                    pid,
-                    stream,
-                    clamped_percent,
-                    speed if speed else None,
-                    eta if eta else None,
-                    completed=is_complete_marker,
-                ),
-                refresh=False,
-            )
-            self._stream_state[key] = (
-                speed if speed else None,
-                eta if eta else None,
-                is_complete_marker,
-            )
-            if is_complete_marker:
-                self._completed_bars.add(key)
-                bar.n = bar.total
-                self._reassign_positions_locked()
-            bar.refresh()
+            # Another thread may have completed the bar since the unlocked check above.
+            if key in self._completed_bars:
+                return
+            bar = self._bars.get(key)
+            if bar is None or self._painter is None:
+                bar = self._get_progress_bar(pid, stream, colour)
+            self._apply_update_locked(key, bar, percent, speed, eta)
 
     def finalise(self) -> list[str]:
+        self._stop_painter()
         with self._lock:
             self._reassign_positions_locked()
-            keys = self._sorted_keys()
+            keys = [key for _, key in self._ordered]
             bars = [self._bars[key] for key in keys]
             lines: list[str] = []
+            # Most bars end in the same state, so each distinct segment is rendered once.
+            segments: Dict[tuple, str] = {}
+            # Every bar writes to the same stream, so the width is looked up only once.
+            try:
+                ncols = bars[0].format_dict["ncols"] if bars else None
+            except Exception:
+                ncols = None
             for key, bar in zip(keys, bars):
                 pid, stream = key
                 colour_style = self._pid_colours.get(pid)
@@ -197,45 +284,138 @@ class ProgressTracker:
                 desc = self._compose_desc(pid, stream, percent, speed, eta, completed)
                 if completed:
                     desc = desc.rstrip() + " "
-                format_dict = bar.format_dict
-                bar_segment = format_dict.get("bar")
-                if not bar_segment:
-                    try:
-                        bar_segment = tqdm.format_meter(
-                            format_dict["n"],
-                            format_dict["total"],
-                            format_dict["elapsed"],
-                            ncols=format_dict["ncols"],
-                            prefix="",
-                            ascii=format_dict["ascii"],
-                            unit=format_dict["unit"],
-                            unit_scale=format_dict["unit_scale"],
-                            rate=format_dict["rate"],
-                            bar_format="{bar}",
-                            postfix=format_dict["postfix"],
-                            unit_divisor=format_dict["unit_divisor"],
-                            initial=format_dict["initial"],
-                            colour=None,
-                        )
-                    except Exception:
-                        bar_segment = ""
-                if bar_segment is None:
-                    bar_segment = ""
+                bar_segment = self._bar_segment(bar, ncols, segments)
                 if colour_style:
-                    bar_segment = f"{colour_style.ansi_code}{bar_segment}{RESET}"
+                    bar_segment = colour_style.colorize(bar_segment)
                 lines.append(f"{desc}|{bar_segment}|")
             for bar in bars:
                 bar.leave = False
             self._bars.clear()
+            self._ordered.clear()
             self._pid_colours.clear()
             self._completed_bars.clear()
             self._stream_state.clear()
+            self._pseudo_timers.clear()
+            self._desc_inputs.clear()
+            self._dirty.clear()
+            self._stopping = False
         for bar in bars:
             bar.close()
         return lines
 
     # Internal helpers -------------------------------------------------
 
+    def _apply_update_locked(
+        self,
+        key: tuple[str, str],
+        bar: tqdm,
+        percent: float,
+        speed: str | None,
+        eta: str | None,
+    ) -> None:
+        clamped_percent = max(0.0, min(100.0, percent))
+        # Assigning n directly (rather than update()/reset()) keeps tqdm from
+        # repainting on its own; the painter thread repaints dirty bars.
+        moved = bar.n != clamped_percent
+        bar.n = clamped_percent
+        speed = speed if speed else None
+        eta = eta if eta else None
+        is_complete_marker = clamped_percent >= 100.0 or eta == "00:00:00"
+        described = self._describe_locked(key, bar, clamped_percent, speed, eta, is_complete_marker)
+        self._stream_state[key] = (speed, eta, is_complete_marker)
+        if is_complete_marker:
+            self._completed_bars.add(key)
+            bar.n = bar.total
+        if moved or described:
+            self._dirty.add(key)
+
+    def _bar_segment(self, bar: tqdm, ncols: int | None, segments: Dict[tuple, str]) -> str:
+        """Render just the ``{bar}`` part of *bar*, reusing *segments* for repeated states."""
+        segment_key = (bar.n, bar.total, bar.ascii)
+        segment = segments.get(segment_key)
+        if segment is None:
+            try:
+                segment = tqdm.format_meter(
+                    bar.n,
+                    bar.total,
+                    0,
+                    ncols=ncols,
+                    prefix="",
+                    ascii=bar.ascii,
+                    bar_format="{bar}",
+                    colour=None,
+                )
+            except Exception:
+                segment = ""
+            segments[segment_key] = segment or ""
+        return segments[segment_key]
+
+    def _start_painter(self) -> None:
+        with self._lock:
+            if self._painter is not None or self._stopping:
+                return
+            self._painter_stop = threading.Event()
+            self._painter = threading.Thread(
+                target=self._painter_loop,
+                args=(self._painter_stop,),
+                name="progress-painter",
+                daemon=True,
+            )
+            self._painter.start()
+
+    def _stop_painter(self) -> None:
+        with self._lock:
+            self._stopping = True
+            painter = self._painter
+            stop = self._painter_stop
+            self._painter = None
+        if painter is None:
+            return
+        stop.set()
+        painter.join()
+
+    def _painter_loop(self, stop: threading.Event) -> None:
+        # One thread repaints every changed bar at a fixed frame rate and animates the
+        # pseudo streams, so download workers only record state and never write to the
+        # terminal themselves.
+        last_tick = time.monotonic()
+        while not stop.wait(PAINT_INTERVAL):
+            now = time.monotonic()
+            if now - last_tick >= HEARTBEAT_INTERVAL:
+                last_tick = now
+                if self._pseudo_timers:
+                    self._tick_pseudo_streams()
+            self._paint_dirty()
+
+    def _tick_pseudo_streams(self) -> None:
+        """Advance every running pseudo stream against one shared timestamp."""
+        now = time.perf_counter()
+        for key, timer in list(self._pseudo_timers.items()):
+            with self._lock:
+                # Only existing bars are advanced, so a tick never (re)starts the painter.
+                bar = self._bars.get(key)
+                if (
+                    self._stopping
+                    or bar is None
+                    or key not in self._pseudo_timers
+                    or key in self._completed_bars
+                ):
+                    continue
+                percent = min(99.0, ((now - timer["start"]) / 300.0) * 100.0)
+                self._apply_update_locked(key, bar, percent, None, None)
+
+    def _paint_dirty(self) -> None:
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+            if not dirty:
+                return
+            bars = [self._bars[key] for _, key in self._ordered if key in dirty]
+        # Paint the frame top to bottom under a single hold of tqdm's write lock, so
+        # tqdm.write() output cannot land between the bars of one frame.
+        with tqdm.get_lock():
+            for bar in bars:
+                bar.refresh(nolock=True)
+
     def _get_progress_bar(self, pid: str, stream: str, colour: ColourStyle) -> tqdm:
         key = (pid, stream)
         with self._lock:
@@ -253,42 +433,47 @@ class ProgressTracker:
                 )
                 bar.bar_format = "{desc}|{bar}|"
                 self._bars[key] = bar
+                entry = ((pid, _stream_sort_key(stream)), key)
+                index = bisect_left(self._ordered, entry)
+                self._ordered.insert(index, entry)
                 self._stream_state[key] = (None, None, False)
-                self._reassign_positions_locked()
-            return bar
-
-    def _sorted_keys(self) -> list[tuple[str, str]]:
-        return sorted(
-            self._bars.keys(),
-            key=lambda item: (item[0], self._stream_sort_key(item[1])),
-        )
-
-    def _stream_sort_key(self, stream: str) -> tuple[int, int, str]:
-        for index, name in enumerate(STREAM_PRIORITY):
-            if stream.startswith(name):
-                return (0, index, stream)
-        return (1, 0, stream)
+                # Only bars at or after the insertion point change position.
+                self._reassign_positions_locked(index)
+            elif self._painter is not None:
+                return bar
+        self._start_painter()
+        return bar
 
     def _program_label(self, pid: str) -> str:
         label = self._pid_labels.get(pid)
         if label:
             return label
-        fallback = f"{pid}: "
-        if len(fallback) < PROGRAM_LABEL_WIDTH:
-            fallback = fallback.ljust(PROGRAM_LABEL_WIDTH)
-        else:
-            fallback = fallback[:PROGRAM_LABEL_WIDTH]
+        fallback = self._fallback_labels.get(pid)
+        if fallback is None:
+            fallback = f"{pid}: "
+            if len(fallback) < PROGRAM_LABEL_WIDTH:
+                fallback = fallback.ljust(PROGRAM_LABEL_WIDTH)
+            else:
+                fallback = fallback[:PROGRAM_LABEL_WIDTH]
+            self._fallback_labels[pid] = fallback
         return fallback
 
     def _format_percent(self, value: float) -> str:
-        return f"{value:6.1f}% "
+        return _percent_field(value)
 
     def _format_meta(self, speed: str | None, eta: str | None, completed: bool = False) -> str:
         if completed:
-            return "(completed)".ljust(META_WIDTH)
+            return COMPLETED_META
+        key = (speed, eta)
+        meta = _META_FIELDS.get(key)
+        if meta is not None:
+            return meta
+        if len(_META_FIELDS) >= FIELD_CACHE_LIMIT:
+            _META_FIELDS.clear()
         eta_val = (eta or DEFAULT_ETA)[:ETA_FIELD_WIDTH].ljust(ETA_FIELD_WIDTH)
         speed_val = (speed or DEFAULT_SPEED)[:SPEED_FIELD_WIDTH].rjust(SPEED_FIELD_WIDTH)
-        return f"(ETA {eta_val}, {speed_val})".ljust(META_WIDTH)
+        meta = _META_FIELDS[key] = f"(ETA {eta_val}, {speed_val})".ljust(META_WIDTH)
+        return meta
 
     def _compose_desc(
         self,
@@ -299,33 +484,57 @@ class ProgressTracker:
         eta: str | None,
         completed: bool = False,
     ) -> str:
-        percent_display = 100.0 if completed else percent
-        stream_display = f"{stream}"[:STREAM_FIELD_WIDTH].ljust(STREAM_FIELD_WIDTH)
-        if stream in PSEUDO_STREAMS:
-            percent_part = self._format_percent(percent_display)
-            meta_part = self._format_meta(speed, eta, completed)
-            if not completed:
-                percent_part = " " * PERCENT_WIDTH
-                meta_part = " " * META_WIDTH
+        if completed:
+            percent_part = self._format_percent(100.0)
+            meta_part = COMPLETED_META
+        elif stream in PSEUDO_STREAMS:
+            percent_part = BLANK_PERCENT
+            meta_part = BLANK_META
+        else:
+            percent_part = self._format_percent(percent)
+            meta_part = self._format_meta(speed, eta)
+        return f"{self._program_label(pid)} {_stream_field(stream)}{percent_part}{meta_part}"
+
+    def _describe_locked(
+        self,
+        key: tuple[str, str],
+        bar: tqdm,
+        percent: float,
+        speed: str | None,
+        eta: str | None,
+        completed: bool,
+    ) -> bool:
+        """Set *bar*'s description unless it would be unchanged; return whether it was set."""
+        pid, stream = key
+        if completed:
+            inputs: tuple = (True, self._pid_labels.get(pid))
+        elif stream in PSEUDO_STREAMS:
+            # Running pseudo streams show neither percent nor meta.
+            inputs = (False, self._pid_labels.get(pid))
         else:
-            percent_part = self._format_percent(percent_display)
-            meta_part = self._format_meta(speed, eta, completed)
-        return f"{self._program_label(pid)} {stream_display}{percent_part}{meta_part}"
+            inputs = (False, self._pid_labels.get(pid), _percent_field(percent), speed, eta)
+        if self._desc_inputs.get(key) == inputs:
+            return False
+        self._desc_inputs[key] = inputs
+        bar.set_description_str(
+            self._compose_desc(pid, stream, percent, speed, eta, completed), refresh=False
+        )
+        return True
 
-    def _reassign_positions_locked(self) -> None:
-        for position, key in enumerate(self._sorted_keys()):
+    def _reassign_positions_locked(self, start: int = 0) -> None:
+        # Display order only changes when a bar is added; completing a stream updates
+        # its own description and needs no reassignment.
+        for position in range(start, len(self._ordered)):
+            key = self._ordered[position][1]
             bar = self._bars[key]
-            pid, stream = key
             speed, eta, completed = self._stream_state.get(
                 key, (None, None, key in self._completed_bars)
             )
-            bar.set_description_str(
-                self._compose_desc(pid, stream, bar.n, speed, eta, completed),
-                refresh=False,
-            )
+            if self._describe_locked(key, bar, bar.n, speed, eta, completed):
+                self._dirty.add(key)
             if bar.pos != position:
                 bar.pos = position
-                bar.refresh()
+                self._dirty.add(key)
 
 
 __all__ = ["ProgressTracker"]
@@ -4,16 +4,27 @@ from __future__ import annotations
 
 import re
 import shlex
-from datetime import datetime
-from typing import Iterable, Optional, Sequence
+import threading
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Generic, Iterable, Optional, Sequence, TypeVar
 
-INVALID_FILENAME_CHARS = re.compile(r"[\\/:*?\"<>|]")
-WHITESPACE_PATTERN = re.compile(r"\s+")
+K = TypeVar("K")
+V = TypeVar("V")
+
+INVALID_FILENAME_TABLE = str.maketrans("", "", '\\/:*?"<>|')
+_TWO_DIGIT = tuple(f"{number:02d}" for number in range(100))
+# Episode and series numbers usually arrive as short digit strings ("3", "07", "12").
+_TWO_DIGIT_TEXT = {
+    text: _TWO_DIGIT[number] for number in range(100) for text in (str(number), _TWO_DIGIT[number])
+}
+# Arguments made only of the characters shlex.quote leaves alone need no quoting.
+_is_shell_safe = re.compile(r"[\w@%+=:,./-]+", re.ASCII).fullmatch
 
 
 def format_command(command: Sequence[str]) -> str:
     """Return a shell-escaped representation of *command*."""
-    return " ".join(shlex.quote(part) for part in command)
+    return " ".join(part if _is_shell_safe(part) else shlex.quote(part) for part in command)
 
 
 def next_delimiter(buffer: str) -> int | None:
@@ -36,36 +47,56 @@ def truncate_title(title: str, max_len: int = 10) -> str:
 
 def two_digit(value: str | int | None) -> str:
     """Return a two digit string representation, defaulting to '00'."""
-    if value is None:
-        return "00"
+    if isinstance(value, str):
+        cached = _TWO_DIGIT_TEXT.get(value)
+        if cached is not None:
+            return cached
+        return _TWO_DIGIT[int(value) % 100] if value.isdecimal() else "00"
     if isinstance(value, int):
-        return f"{value % 100:02d}"
-    if isinstance(value, str) and value.isdigit():
-        return f"{int(value) % 100:02d}"
+        return _TWO_DIGIT[value % 100]
     return "00"
 
 
 def sanitize_filename_component(value: str | None) -> str:
-    cleaned = INVALID_FILENAME_CHARS.sub("", (value or "").strip())
-    cleaned = WHITESPACE_PATTERN.sub(" ", cleaned).strip()
-    return cleaned
+    # split()/join() collapses whitespace runs and trims the ends in one step.
+    return " ".join((value or "").translate(INVALID_FILENAME_TABLE).split())
 
 
 def dedupe_preserve_order(items: Iterable[str]) -> list[str]:
     """Deduplicate while preserving iteration order."""
-    seen: set[str] = set()
-    result: list[str] = []
-    for item in items:
-        if item not in seen:
-            seen.add(item)
-            result.append(item)
-    return result
+    # dicts keep insertion order, so fromkeys() dedupes in a single C-level pass.
+    return list(dict.fromkeys(items))
+
+
+class LRUCache(OrderedDict, Generic[K, V]):
+    """Thread-safe mapping that evicts its least recently used entries beyond *maxsize*."""
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        with self._lock:
+            if key not in self:
+                return default
+            self.move_to_end(key)
+            return super().__getitem__(key)
+
+    def __setitem__(self, key: K, value: V) -> None:
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            while len(self) > self.maxsize:
+                self.popitem(last=False)
 
 
 def safe_int_to_str(value: Optional[int | str]) -> str:
     if isinstance(value, int):
         return str(value)
-    if isinstance(value, str) and value.isdigit():
+    # isdecimal() rather than isdigit(): superscripts such as "²" are digits that int()
+    # rejects, and two_digit() turns this result into an int.
+    if isinstance(value, str) and value.isdecimal():
         return value
     return ""
 
@@ -73,8 +104,19 @@ def safe_int_to_str(value: Optional[int | str]) -> str:
 def extract_broadcast_date(node: dict) -> str:
     """Return YYYYMMDD from first_broadcast_date if available."""
     date_str = node.get("first_broadcast_date")
-    if not date_str:
+    if not date_str or not isinstance(date_str, str):
         return ""
+    # BBC timestamps are "YYYY-MM-DD" or "YYYY-MM-DDTHH:MM:SSZ"; the date is the prefix as
+    # written (fromisoformat does not shift offsets), so slice it and only validate it.
+    if len(date_str) >= 10 and date_str[4] == "-" and date_str[7] == "-":
+        year, month, day = date_str[:4], date_str[5:7], date_str[8:10]
+        compact = year + month + day
+        if compact.isascii() and compact.isdigit() and date_str[10:11] in ("", "T"):
+            try:
+                date(int(year), int(month), int(day))
+            except ValueError:
+                return ""
+            return compact
     try:
         dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
         return dt.strftime("%Y%m%d")
@@ -83,6 +125,7 @@ def extract_broadcast_date(node: dict) -> str:
 
 
 __all__ = [
+    "LRUCache",
     "dedupe_preserve_order",
     "extract_broadcast_date",
     "format_command",
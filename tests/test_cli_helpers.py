@@ -1,6 +1,8 @@
 import json
 import os
+import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
 
@@ -42,6 +44,7 @@ def install_fake_requests(monkeypatch, responses):
         return FakeResponse(payload, status_code)
 
     monkeypatch.setattr(cli.requests, "get", _fake_get)
+    monkeypatch.setattr(cli.metadata._SESSION, "get", _fake_get)
 
 
 @pytest.fixture(autouse=True)
@@ -120,6 +123,7 @@ def test_two_digit_handles_int_str_and_invalid():
     assert cli._two_digit("42") == "42"
     assert cli._two_digit("abc") == "00"
     assert cli._two_digit(None) == "00"
+    assert cli._two_digit("²") == "00"
 
 
 def test_sanitize_filename_component_strips_invalid_characters():
@@ -191,11 +195,17 @@ def test_extract_broadcast_date_returns_empty_on_failure():
     assert cli._extract_broadcast_date(node) == ""
 
 
+def test_extract_broadcast_date_ignores_non_string_values():
+    assert cli._extract_broadcast_date({"first_broadcast_date": 20240610}) == ""
+    assert cli._extract_broadcast_date({"first_broadcast_date": ["2024-06-10"]}) == ""
+
+
 def test_safe_int_to_str_accepts_int_and_numeric_str():
     assert cli._safe_int_to_str(7) == "7"
     assert cli._safe_int_to_str("12") == "12"
     assert cli._safe_int_to_str("abc") == ""
     assert cli._safe_int_to_str(None) == ""
+    assert cli._safe_int_to_str("²") == ""
 
 
 def test_get_bbc_episode_pids_returns_single_episode(monkeypatch):
@@ -265,3 +275,401 @@ def test_get_bbc_episode_pids_falls_back_to_get_iplayer(monkeypatch):
 
     result = cli.get_bbc_episode_pids(series_pid)
     assert result == ["via-fallback"]
+
+
+def test_line_buffer_splits_lines_and_reports_carriage_partials():
+    line_buffer = cli.LineBuffer()
+    assert line_buffer.feed(b"first\nsecond\n  10.0%") == ["first", "second"]
+    assert line_buffer.feed(b" done\r  20.0%") == ["  10.0% done", "  20.0%"]
+    assert line_buffer.feed(b"") == []
+    assert line_buffer.feed(b" more\r") == ["  20.0% more"]
+    assert line_buffer.feed(b"\n\ncaf\xc3") == []
+    assert line_buffer.finish() == ["caf�"]
+
+
+def test_line_buffer_holds_back_split_code_point_in_partials():
+    line_buffer = cli.LineBuffer()
+    assert line_buffer.feed(b"x\r  10.0% caf\xc3") == ["x", "  10.0% caf"]
+    assert line_buffer.feed(b"\xa9\r") == ["  10.0% caf\u00e9"]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="PTYs are POSIX only")
+def test_pty_pump_queues_output_then_eof():
+    master_fd, slave_fd = os.openpty()
+    output = cli.downloader.ChunkQueue()
+    pump = cli.downloader.PtyPump(master_fd, output)
+    os.write(slave_fd, b"  50.0%\r")
+    os.close(slave_fd)
+    chunks = []
+    while (chunk := output.get(5.0)) != b"":
+        assert chunk is not None
+        chunks.append(chunk)
+    assert b"".join(chunks) == b"  50.0%\r"
+    pump.close()
+    pump.raise_error()
+
+
+@pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="needs pidfd_open")
+def test_pty_pump_ends_when_child_exits_despite_open_pty():
+    master_fd, slave_fd = os.openpty()
+    # The backgrounded sleep inherits the PTY and keeps it open after sh exits.
+    process = subprocess.Popen(["sh", "-c", "sleep 5 & echo done"], stdout=slave_fd)
+    os.close(slave_fd)
+    output = cli.downloader.ChunkQueue()
+    pump = cli.downloader.PtyPump(master_fd, output, process.pid)
+    started = time.monotonic()
+    chunks = []
+    while (chunk := output.get(5.0)) != b"":
+        assert chunk is not None
+        chunks.append(chunk)
+    assert time.monotonic() - started < 2.5
+    assert b"".join(chunks).strip() == b"done"
+    pump.close()
+    assert process.wait() == 0
+
+
+def test_locate_download_directory_scans_for_suffix_match(temp_cwd):
+    (temp_cwd / ".auntie-other-p0abc123-1a2b3c4d").write_text("not a directory")
+    expected = temp_cwd / ".auntie-renamed-p0abc123-1a2b3c4d"
+    expected.mkdir()
+    found = cli._locate_download_directory("1a2b3c4d", "p0abc123")
+    assert found == expected
+
+
+def test_expand_pids_preserves_input_order_and_dedupes(monkeypatch):
+    episodes = {
+        "b006m8v5": ["b06nxnl4", "b06mty6m"],
+        "b04vs4r9": ["b06mty6m", "b06mtnf1"],
+    }
+
+    def _fake_get_bbc_episode_pids(pid, fallback=True):
+        if pid == "p0broken":
+            raise RuntimeError("lookup failed")
+        time.sleep(0.05 if pid == "b006m8v5" else 0)
+        return episodes.get(pid, [])
+
+    monkeypatch.setattr(cli.expansion, "get_bbc_episode_pids", _fake_get_bbc_episode_pids)
+
+    result = cli.expand_pids(["b006m8v5", "p0broken", "B04VS4R9"])
+    assert result == ["b06nxnl4", "b06mty6m", "p0broken", "b06mtnf1"]
+
+
+def test_expand_pids_batches_get_iplayer_fallback(monkeypatch):
+    commands = []
+
+    def _fake_run(cmd, **kwargs):
+        commands.append(cmd)
+        stdout = (
+            b"Episodes:\nShow A: Series 1 - 1. One, BBC One, b0000001\n"
+            b"INFO: 1 total programmes\n"
+            b"Episodes:\nShow B: Series 1 - 1. One, BBC Two, b0000002\n"
+        )
+        return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr=b"")
+
+    monkeypatch.setattr(cli.expansion, "get_bbc_episode_pids", lambda pid, fallback=True: [])
+    monkeypatch.setattr(cli.metadata, "get_iplayer_invocation", lambda: ("get_iplayer",))
+    monkeypatch.setattr(cli.metadata.subprocess, "run", _fake_run)
+
+    result = cli.expand_pids(["p0000001", "p0000002"])
+    assert result == ["b0000001", "b0000002"]
+    assert commands == [["get_iplayer", "--pid-recursive-list", "--pid=p0000001", "--pid=p0000002"]]
+
+
+def test_batch_expansion_timeout_is_capped(monkeypatch):
+    timeouts = []
+
+    def _fake_run(cmd, **kwargs):
+        timeouts.append(kwargs["timeout"])
+        return subprocess.CompletedProcess(cmd, 0, stdout=b"", stderr=b"")
+
+    monkeypatch.setattr(cli.metadata, "get_iplayer_invocation", lambda: ("get_iplayer",))
+    monkeypatch.setattr(cli.metadata.subprocess, "run", _fake_run)
+
+    pids = [f"p{index:07d}" for index in range(50)]
+    cli.get_bbc_episode_pids_via_get_iplayer_batch(pids)
+    assert timeouts[0] == cli.metadata.BATCH_EXPANSION_TIMEOUT
+
+
+def test_colour_for_index_wraps_around_palette():
+    palette = cli.COLOUR_STYLES
+    assert cli.colour_for_index(0) == palette[0]
+    assert cli.colour_for_index(len(palette) + 2) == palette[2]
+
+
+def test_emit_progress_lines_coalesces_updates_per_stream(monkeypatch):
+    tracker = cli.ProgressTracker()
+    calls = []
+    monkeypatch.setattr(
+        tracker,
+        "update_stream",
+        lambda pid, stream, percent, colour, speed, eta: calls.append((stream, percent, eta)),
+    )
+    monkeypatch.setattr(tracker, "complete_pseudo_stream", lambda *args: None)
+
+    lines = [
+        "  10.0% of ~1.00 MB @  5.2 Mb/s ETA: 00:00:09 (hlsvideo/1) [video]",
+        "",
+        "  20.0% of ~1.00 MB @  5.4 Mb/s ETA: 00:00:08 (hlsvideo/1) [video]",
+        "INFO: Downloaded: 1.00 MB (0:00:01) @ 6.1 Mb/s (hlsaudio/1) [audio]",
+        "   1.0% of ~1.00 MB @  5.2 Mb/s ETA: 00:00:59 (hlsaudio/1) [audio]",
+        "INFO: Processing tv: 'Show'",
+    ]
+    tracker.emit_progress_lines("p0abc123", cli.COLOUR_STYLES[0], lines)
+
+    assert calls == [("video", 20.0, "00:00:08"), ("audio", 100.0, "00:00:00")]
+
+
+def test_colour_style_colorize_wraps_text_in_reset():
+    style = cli.ColourStyle("#000000", "\033[38;2;0;0;0m")
+    assert style.colorize("{bar}") == "\033[38;2;0;0;0m{bar}" + cli.RESET
+
+
+def test_get_cached_metadata_persists_to_disk(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(cli.metadata, "_metadata_db", None)
+    monkeypatch.setattr(cli.metadata, "_metadata_db_failed", False)
+    monkeypatch.setattr(cli.metadata, "PID_METADATA", {})
+    fetched = []
+
+    def _fake_metadata(pid):
+        fetched.append(pid)
+        return {"show_title": "My Show", "episode_title": "Pilot"}
+
+    monkeypatch.setattr(cli.metadata, "bbc_metadata_from_pid", _fake_metadata)
+
+    assert cli.get_cached_metadata("p0abc123")["show_title"] == "My Show"
+    monkeypatch.setattr(cli.metadata, "PID_METADATA", {})
+    assert cli.get_cached_metadata("p0abc123")["episode_title"] == "Pilot"
+    assert fetched == ["p0abc123"]
+    assert (tmp_path / "auntie" / "metadata.sqlite").exists()
+    cli.metadata._metadata_db.close()
+
+
+def test_bbc_metadata_from_pid_reuses_payload_from_expansion(monkeypatch):
+    episode_pid = "b03tzlwv"
+    url = f"https://www.bbc.co.uk/programmes/{episode_pid}.json"
+    install_fake_requests(monkeypatch, {url: load_fixture("episode.json")})
+    assert cli.get_bbc_episode_pids(episode_pid) == [episode_pid]
+
+    install_fake_requests(monkeypatch, {})
+    metadata = cli.bbc_metadata_from_pid(episode_pid)
+    assert metadata["episode_title"]
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = cli.LRUCache(2)
+    cache["a"] = {"show_title": "A"}
+    cache["b"] = {"show_title": "B"}
+    assert cache.get("a") == {"show_title": "A"}
+    cache["c"] = {"show_title": "C"}
+    assert list(cache) == ["a", "c"]
+    assert cache.get("b") is None
+
+
+def test_build_program_label_tracks_metadata_updates(monkeypatch):
+    monkeypatch.setattr(cli.metadata, "PID_METADATA", {})
+    pid = "b0000001"
+    cli.metadata.PID_METADATA[pid] = {"show_title": "Show", "episode_title": "One"}
+    label = cli.build_program_label(pid)
+    assert label.split() == ["b0000001:", "Show", "-", "s00e00", "-", "One"]
+    assert len(label) == cli.PROGRAM_LABEL_WIDTH
+    assert cli.build_program_label(pid) is label
+
+    cli.metadata.PID_METADATA[pid] = {"show_title": "Show", "episode_title": "Two"}
+    assert cli.build_program_label(pid).split()[-1] == "Two"
+
+
+def test_fetch_children_programmes_requests_remaining_pages_in_order(monkeypatch):
+    pid = "b0000001"
+    base_url = f"https://www.bbc.co.uk/programmes/{pid}/children.json?page="
+    pages = [["e1", "e2"], ["e3", "e4"], ["e5"]]
+    responses = {
+        f"{base_url}{number}": {
+            "children": {
+                "total": 5,
+                "programmes": [{"type": "episode", "pid": child} for child in children],
+            }
+        }
+        for number, children in enumerate(pages, start=1)
+    }
+    install_fake_requests(monkeypatch, responses)
+
+    programmes = cli.metadata.fetch_children_programmes(pid, timeout=5)
+    assert [item["pid"] for item in programmes] == ["e1", "e2", "e3", "e4", "e5"]
+
+
+@pytest.mark.parametrize(
+    "candidate, expected",
+    [
+        ("b006m8v5", True),
+        ("B006M8V5", True),
+        ("b006a8v5", False),
+        ("b006m8", False),
+        ("1b06m8v5", False),
+    ],
+)
+def test_is_pid_matches_pid_pattern(candidate, expected):
+    assert cli.is_pid(candidate) is expected
+    assert bool(cli.PID_PATTERN.fullmatch(candidate)) is expected
+
+
+class _RecordingTqdm:
+    refreshes: list = []
+    descriptions: list = []
+    ascii = False
+    format_dict = {"ncols": None}
+
+    def __init__(self, *args, **kwargs):
+        self.n = 0.0
+        self.total = kwargs.get("total", 0.0)
+        self.pos = kwargs.get("position", 0)
+
+    def set_description_str(self, desc, refresh=True):
+        self.descriptions.append(desc)
+
+    def refresh(self, *args, **kwargs):
+        self.refreshes.append(self.n)
+
+    def close(self):
+        pass
+
+    @staticmethod
+    def get_lock():
+        return threading.Lock()
+
+
+@pytest.fixture
+def fake_tqdm(monkeypatch):
+    class _Bars(_RecordingTqdm):
+        refreshes = []
+        descriptions = []
+
+    monkeypatch.setattr(cli.progress, "tqdm", _Bars)
+    monkeypatch.setattr(cli.ProgressTracker, "_start_painter", lambda self: None)
+    return _Bars
+
+
+def test_update_stream_leaves_repainting_to_the_painter(fake_tqdm):
+    tracker = cli.ProgressTracker()
+    colour = cli.COLOUR_STYLES[0]
+
+    tracker.update_stream("p0abc123", "video", 10.0, colour, "5 Mb/s", "00:00:09")
+    tracker.update_stream("p0abc123", "video", 20.0, colour, "5 Mb/s", "00:00:08")
+    assert fake_tqdm.refreshes == []
+
+    tracker._paint_dirty()
+    tracker._paint_dirty()
+    assert fake_tqdm.refreshes == [20.0]
+
+
+def test_update_stream_skips_unchanged_descriptions(fake_tqdm):
+    descriptions = fake_tqdm.descriptions
+    tracker = cli.ProgressTracker()
+    colour = cli.COLOUR_STYLES[0]
+
+    tracker.update_stream("p0abc123", "video", 10.01, colour, "5 Mb/s", "00:00:09")
+    count = len(descriptions)
+    tracker.update_stream("p0abc123", "video", 10.02, colour, "5 Mb/s", "00:00:09")
+    assert len(descriptions) == count
+
+    tracker.update_stream("p0abc123", "video", 10.5, colour, "5 Mb/s", "00:00:09")
+    assert len(descriptions) == count + 1
+    assert "10.5%" in descriptions[-1]
+
+
+def test_progress_bars_are_kept_in_display_order(fake_tqdm):
+    tracker = cli.ProgressTracker()
+    colour = cli.COLOUR_STYLES[0]
+
+    for pid, stream in [("b2", "converting"), ("b1", "video"), ("b2", "waiting"), ("b1", "audio")]:
+        tracker.update_stream(pid, stream, 5.0, colour, None, None)
+
+    assert [key for _, key in tracker._ordered] == [
+        ("b1", "audio"),
+        ("b1", "video"),
+        ("b2", "waiting"),
+        ("b2", "converting"),
+    ]
+    assert [tracker._bars[key].pos for _, key in tracker._ordered] == [0, 1, 2, 3]
+
+
+def test_pseudo_stream_tick_does_not_undo_completion(fake_tqdm):
+    tracker = cli.ProgressTracker()
+    colour = cli.COLOUR_STYLES[0]
+    key = ("p0abc123", "converting")
+    tracker.start_pseudo_stream(*key, colour)
+
+    with tracker._lock:
+        ticker = threading.Thread(target=tracker._tick_pseudo_streams)
+        ticker.start()
+        time.sleep(0.05)
+        tracker.complete_pseudo_stream(*key, colour)
+    ticker.join()
+
+    bar = tracker._bars[key]
+    assert tracker._stream_state[key][2] is True
+    assert bar.n == bar.total
+
+
+def test_cached_metadata_releases_expansion_payload(monkeypatch):
+    monkeypatch.setitem(cli.metadata.PID_METADATA, "p0abc123", {"title": "Cached"})
+    monkeypatch.setitem(cli.metadata._EPISODE_PAYLOADS, "p0abc123", {"programme": {}})
+
+    assert cli.metadata.get_cached_metadata("p0abc123") == {"title": "Cached"}
+    assert "p0abc123" not in cli.metadata._EPISODE_PAYLOADS
+
+
+def test_nested_http_maps_share_one_worker_budget():
+    lock = threading.Lock()
+    threads = set()
+
+    def fetch(item):
+        with lock:
+            threads.add(threading.get_ident())
+        time.sleep(0.01)
+        return item
+
+    def expand(item):
+        return cli.map_http(fetch, range(8), 8)
+
+    results = cli.map_http(expand, range(16), 16)
+
+    assert results == [list(range(8))] * 16
+    assert len(threads) <= cli.metadata.HTTP_POOL_SIZE
+    assert cli.metadata._http_workers_free == cli.metadata.HTTP_POOL_SIZE
+
+
+def test_finalise_stops_painter_while_pseudo_stream_ticks(monkeypatch):
+    monkeypatch.setattr(cli.progress, "tqdm", _RecordingTqdm)
+    monkeypatch.setattr(cli.progress, "PAINT_INTERVAL", 0.0005)
+    monkeypatch.setattr(cli.progress, "HEARTBEAT_INTERVAL", 0.0)
+    tracker = cli.ProgressTracker()
+    colour = cli.COLOUR_STYLES[0]
+
+    for index in range(200):
+        tracker.start_pseudo_stream(f"p{index:07d}", "waiting", colour)
+        time.sleep(0.001)
+        finaliser = threading.Thread(target=tracker.finalise, daemon=True)
+        finaliser.start()
+        finaliser.join(timeout=5)
+        assert not finaliser.is_alive()
+
+    tracker.reset()
+    painters = [t for t in threading.enumerate() if t.name == "progress-painter"]
+    assert painters == []
+
+
+def test_finalise_drops_unfinished_pseudo_streams(fake_tqdm):
+    tracker = cli.ProgressTracker()
+    tracker.start_pseudo_stream("p0abc123", "converting", cli.COLOUR_STYLES[0])
+
+    tracker.finalise()
+    tracker._tick_pseudo_streams()
+
+    assert tracker._pseudo_timers == {}
+    assert tracker._bars == {}
+
+
+def test_dedupe_preserve_order_keeps_first_occurrence():
+    assert cli.dedupe_preserve_order(["b", "a", "b", "c", "a"]) == ["b", "a", "c"]
+    assert cli.dedupe_preserve_order(iter([])) == []